@@ -1,10 +1,785 @@
+import copy
+import functools
+import heapq
+import itertools
 import json
-import random
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from enum import IntEnum
+from types import MappingProxyType
 import numpy as np
 
+# sklearn is imported lazily inside the methods that need it: its import
+# costs several hundred ms, which would otherwise land on every cold
+# worker start even though most requests never touch the fuzzy matcher.
+
+
+# Static curriculum module templates, built once at import time.
+# build_curriculum deep-copies the assembled template per request instead
+# of re-constructing these literals on every call.
+_FULLSTACK_BEGINNER_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Programming Fundamentals',
+		'description': 'Core programming concepts and problem-solving',
+		'order': 1,
+		'difficulty': 'beginner',
+		'topics': [
+			{
+				'id': 'topic_1_1',
+				'title': 'Introduction to Programming',
+				'description': 'Variables, data types, and basic operations',
+				'prerequisites': [],
+				'subtopics': ['Variables', 'Data Types', 'Operators', 'Input/Output']
+			},
+			{
+				'id': 'topic_1_2',
+				'title': 'Control Structures',
+				'description': 'If statements, loops, and logical thinking',
+				'prerequisites': ['Introduction to Programming'],
+				'subtopics': ['Conditionals', 'For Loops', 'While Loops', 'Break & Continue']
+			},
+			{
+				'id': 'topic_1_3',
+				'title': 'Functions and Scope',
+				'description': 'Creating reusable code blocks',
+				'prerequisites': ['Control Structures'],
+				'subtopics': ['Function Basics', 'Parameters', 'Return Values', 'Scope']
+			},
+			{
+				'id': 'topic_1_4',
+				'title': 'Data Structures Basics',
+				'description': 'Arrays, lists, and dictionaries',
+				'prerequisites': ['Functions and Scope'],
+				'subtopics': ['Arrays', 'Lists', 'Objects', 'Iteration']
+			},
+			{
+				'id': 'topic_1_5',
+				'title': 'Version Control with Git',
+				'description': 'Managing code with Git and GitHub',
+				'prerequisites': [],
+				'subtopics': ['Git Basics', 'Commits', 'Branches', 'GitHub']
+			}
+		]
+	},
+	{
+		'id': 'module_2',
+		'title': 'Frontend Development',
+		'description': 'Building user interfaces with HTML, CSS, and JavaScript',
+		'order': 2,
+		'difficulty': 'beginner',
+		'topics': [
+			{
+				'id': 'topic_2_1',
+				'title': 'HTML5 Fundamentals',
+				'description': 'Structure web content with semantic HTML',
+				'prerequisites': [],
+				'subtopics': ['HTML Elements', 'Semantic HTML', 'Forms', 'Accessibility']
+			},
+			{
+				'id': 'topic_2_2',
+				'title': 'CSS3 Styling',
+				'description': 'Style and layout web pages',
+				'prerequisites': ['HTML5 Fundamentals'],
+				'subtopics': ['Selectors', 'Box Model', 'Flexbox', 'Grid', 'Responsive Design']
+			},
+			{
+				'id': 'topic_2_3',
+				'title': 'JavaScript for Web',
+				'description': 'Make websites interactive',
+				'prerequisites': ['CSS3 Styling', 'Functions and Scope'],
+				'subtopics': ['DOM Manipulation', 'Events', 'Form Validation', 'Async JavaScript']
+			},
+			{
+				'id': 'topic_2_4',
+				'title': 'Modern CSS',
+				'description': 'Advanced styling techniques',
+				'prerequisites': ['CSS3 Styling'],
+				'subtopics': ['Animations', 'Transitions', 'Custom Properties', 'CSS Architecture']
+			}
+		]
+	},
+	{
+		'id': 'module_3',
+		'title': 'React Framework',
+		'description': 'Build dynamic UIs with React',
+		'order': 3,
+		'difficulty': 'intermediate',
+		'topics': [
+			{
+				'id': 'topic_3_1',
+				'title': 'React Fundamentals',
+				'description': 'Components, props, and JSX',
+				'prerequisites': ['JavaScript for Web'],
+				'subtopics': ['Components', 'Props', 'JSX', 'Rendering']
+			},
+			{
+				'id': 'topic_3_2',
+				'title': 'State Management',
+				'description': 'Managing component state',
+				'prerequisites': ['React Fundamentals'],
+				'subtopics': ['useState', 'useEffect', 'Lifting State', 'Context API']
+			},
+			{
+				'id': 'topic_3_3',
+				'title': 'React Router',
+				'description': 'Navigation in React apps',
+				'prerequisites': ['State Management'],
+				'subtopics': ['Routes', 'Navigation', 'Parameters', 'Protected Routes']
+			},
+			{
+				'id': 'topic_3_4',
+				'title': 'API Integration',
+				'description': 'Fetching and displaying data',
+				'prerequisites': ['State Management'],
+				'subtopics': ['Fetch API', 'Axios', 'Loading States', 'Error Handling']
+			}
+		]
+	},
+	{
+		'id': 'module_4',
+		'title': 'Backend Development with Python',
+		'description': 'Server-side programming and APIs',
+		'order': 4,
+		'difficulty': 'intermediate',
+		'topics': [
+			{
+				'id': 'topic_4_1',
+				'title': 'Python Fundamentals',
+				'description': 'Python syntax and core concepts',
+				'prerequisites': ['Programming Fundamentals'],
+				'subtopics': ['Python Syntax', 'OOP Basics', 'Modules', 'Error Handling']
+			},
+			{
+				'id': 'topic_4_2',
+				'title': 'Flask Framework',
+				'description': 'Building web applications with Flask',
+				'prerequisites': ['Python Fundamentals'],
+				'subtopics': ['Routes', 'Templates', 'Request/Response', 'Blueprints']
+			},
+			{
+				'id': 'topic_4_3',
+				'title': 'RESTful API Design',
+				'description': 'Creating and documenting APIs',
+				'prerequisites': ['Flask Framework'],
+				'subtopics': ['REST Principles', 'HTTP Methods', 'Status Codes', 'JSON']
+			},
+			{
+				'id': 'topic_4_4',
+				'title': 'Database Integration',
+				'description': 'Working with databases',
+				'prerequisites': ['Flask Framework'],
+				'subtopics': ['SQL Basics', 'SQLAlchemy', 'CRUD Operations', 'Relationships']
+			},
+			{
+				'id': 'topic_4_5',
+				'title': 'Authentication & Security',
+				'description': 'Securing your applications',
+				'prerequisites': ['RESTful API Design', 'Database Integration'],
+				'subtopics': ['JWT', 'Password Hashing', 'CORS', 'Input Validation']
+			}
+		]
+	},
+	{
+		'id': 'module_5',
+		'title': 'Database Management',
+		'description': 'Data modeling and database operations',
+		'order': 5,
+		'difficulty': 'intermediate',
+		'topics': [
+			{
+				'id': 'topic_5_1',
+				'title': 'SQL Fundamentals',
+				'description': 'Querying relational databases',
+				'prerequisites': [],
+				'subtopics': ['SELECT Queries', 'JOINs', 'Aggregations', 'Subqueries']
+			},
+			{
+				'id': 'topic_5_2',
+				'title': 'Database Design',
+				'description': 'Schema design and normalization',
+				'prerequisites': ['SQL Fundamentals'],
+				'subtopics': ['ER Diagrams', 'Normalization', 'Indexes', 'Constraints']
+			},
+			{
+				'id': 'topic_5_3',
+				'title': 'NoSQL Databases',
+				'description': 'Document databases and MongoDB',
+				'prerequisites': ['Database Design'],
+				'subtopics': ['MongoDB Basics', 'Collections', 'Queries', 'Aggregation']
+			},
+			{
+				'id': 'topic_5_4',
+				'title': 'Database Optimization',
+				'description': 'Performance tuning',
+				'prerequisites': ['Database Design'],
+				'subtopics': ['Query Optimization', 'Indexing Strategies', 'Caching', 'Transactions']
+			}
+		]
+	},
+	{
+		'id': 'module_6',
+		'title': 'Full Stack Integration',
+		'description': 'Connecting frontend and backend',
+		'order': 6,
+		'difficulty': 'advanced',
+		'topics': [
+			{
+				'id': 'topic_6_1',
+				'title': 'Frontend-Backend Communication',
+				'description': 'Connecting React to Flask API',
+				'prerequisites': ['API Integration', 'RESTful API Design'],
+				'subtopics': ['API Calls', 'State Management', 'Error Handling', 'Loading States']
+			},
+			{
+				'id': 'topic_6_2',
+				'title': 'File Upload & Management',
+				'description': 'Handling files in full stack apps',
+				'prerequisites': ['Frontend-Backend Communication'],
+				'subtopics': ['Multer/FormData', 'File Storage', 'Image Processing', 'Cloud Storage']
+			},
+			{
+				'id': 'topic_6_3',
+				'title': 'Real-time Features',
+				'description': 'WebSockets and live updates',
+				'prerequisites': ['Frontend-Backend Communication'],
+				'subtopics': ['WebSockets', 'Socket.io', 'Real-time Notifications', 'Chat Features']
+			},
+			{
+				'id': 'topic_6_4',
+				'title': 'Testing Full Stack Apps',
+				'description': 'Unit and integration testing',
+				'prerequisites': ['Frontend-Backend Communication'],
+				'subtopics': ['Jest', 'Pytest', 'Integration Tests', 'E2E Testing']
+			}
+		]
+	},
+	{
+		'id': 'module_7',
+		'title': 'Deployment & DevOps',
+		'description': 'Deploy applications to production',
+		'order': 7,
+		'difficulty': 'advanced',
+		'topics': [
+			{
+				'id': 'topic_7_1',
+				'title': 'Cloud Platforms',
+				'description': 'Deploy to cloud services',
+				'prerequisites': ['Full Stack Integration'],
+				'subtopics': ['Heroku', 'AWS', 'DigitalOcean', 'Vercel/Netlify']
+			},
+			{
+				'id': 'topic_7_2',
+				'title': 'Docker Containerization',
+				'description': 'Package apps with Docker',
+				'prerequisites': ['Cloud Platforms'],
+				'subtopics': ['Docker Basics', 'Dockerfile', 'Docker Compose', 'Container Management']
+			},
+			{
+				'id': 'topic_7_3',
+				'title': 'CI/CD Pipelines',
+				'description': 'Automate deployment',
+				'prerequisites': ['Docker Containerization'],
+				'subtopics': ['GitHub Actions', 'Automated Testing', 'Deployment Automation', 'Rollbacks']
+			},
+			{
+				'id': 'topic_7_4',
+				'title': 'Monitoring & Logging',
+				'description': 'Application monitoring',
+				'prerequisites': ['CI/CD Pipelines'],
+				'subtopics': ['Error Tracking', 'Performance Monitoring', 'Logging', 'Analytics']
+			}
+		]
+	},
+	{
+		'id': 'module_8',
+		'title': 'Capstone Project',
+		'description': 'Build a complete full stack application',
+		'order': 8,
+		'difficulty': 'advanced',
+		'topics': [
+			{
+				'id': 'topic_8_1',
+				'title': 'Project Planning',
+				'description': 'Design your application',
+				'prerequisites': ['Deployment & DevOps'],
+				'subtopics': ['Requirements', 'Database Schema', 'API Design', 'UI Mockups']
+			},
+			{
+				'id': 'topic_8_2',
+				'title': 'Backend Implementation',
+				'description': 'Build the server and database',
+				'prerequisites': ['Project Planning'],
+				'subtopics': ['API Endpoints', 'Database Models', 'Authentication', 'Business Logic']
+			},
+			{
+				'id': 'topic_8_3',
+				'title': 'Frontend Implementation',
+				'description': 'Build the user interface',
+				'prerequisites': ['Project Planning'],
+				'subtopics': ['Components', 'State Management', 'API Integration', 'Styling']
+			},
+			{
+				'id': 'topic_8_4',
+				'title': 'Testing & Deployment',
+				'description': 'Test and deploy your app',
+				'prerequisites': ['Backend Implementation', 'Frontend Implementation'],
+				'subtopics': ['Testing', 'Bug Fixes', 'Optimization', 'Production Deployment']
+			}
+		]
+	}
+]
+
+_FULLSTACK_ADVANCED_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Advanced React Patterns',
+		'description': 'Advanced React techniques',
+		'order': 1,
+		'difficulty': 'advanced',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Custom Hooks', 'description': 'Create reusable logic', 'prerequisites': [], 'subtopics': []},
+			{'id': 'topic_1_2', 'title': 'Context & Performance', 'description': 'Optimize React apps', 'prerequisites': ['Custom Hooks'], 'subtopics': []},
+			{'id': 'topic_1_3', 'title': 'Advanced State Management', 'description': 'Redux, Zustand, Jotai', 'prerequisites': ['Context & Performance'], 'subtopics': []}
+		]
+	},
+	# Add more advanced modules...
+]
+
+_FRONTEND_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'HTML & CSS Mastery',
+		'description': 'Master modern HTML and CSS',
+		'order': 1,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Semantic HTML5', 'description': 'Modern HTML structure', 'prerequisites': [], 'subtopics': ['Elements', 'Accessibility', 'SEO']},
+			{'id': 'topic_1_2', 'title': 'Advanced CSS', 'description': 'Flexbox, Grid, Animations', 'prerequisites': ['Semantic HTML5'], 'subtopics': ['Flexbox', 'Grid', 'Animations', 'Responsive']},
+			{'id': 'topic_1_3', 'title': 'CSS Preprocessors', 'description': 'SASS/SCSS', 'prerequisites': ['Advanced CSS'], 'subtopics': ['Variables', 'Mixins', 'Nesting']},
+		]
+	},
+	# Add more frontend modules...
+]
+
+_BACKEND_BEGINNER_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Programming Fundamentals',
+		'description': 'Core programming concepts with Python',
+		'order': 1,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Python Basics', 'description': 'Variables, data types, and operations', 'prerequisites': [], 'subtopics': ['Variables', 'Data Types', 'Operators', 'Input/Output']},
+			{'id': 'topic_1_2', 'title': 'Control Flow', 'description': 'Conditionals and loops', 'prerequisites': ['Python Basics'], 'subtopics': ['If/Else', 'For Loops', 'While Loops', 'Break/Continue']},
+			{'id': 'topic_1_3', 'title': 'Functions & Modules', 'description': 'Creating reusable code', 'prerequisites': ['Control Flow'], 'subtopics': ['Functions', 'Parameters', 'Return Values', 'Modules']},
+			{'id': 'topic_1_4', 'title': 'Data Structures', 'description': 'Lists, dictionaries, and sets', 'prerequisites': ['Functions & Modules'], 'subtopics': ['Lists', 'Dictionaries', 'Sets', 'Tuples']},
+		]
+	},
+	{
+		'id': 'module_2',
+		'title': 'Web Fundamentals',
+		'description': 'Understanding HTTP and web protocols',
+		'order': 2,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_2_1', 'title': 'HTTP Basics', 'description': 'Understanding HTTP protocol', 'prerequisites': [], 'subtopics': ['HTTP Methods', 'Status Codes', 'Headers', 'Request/Response']},
+			{'id': 'topic_2_2', 'title': 'REST API Concepts', 'description': 'RESTful architecture principles', 'prerequisites': ['HTTP Basics'], 'subtopics': ['REST Principles', 'Resources', 'Endpoints', 'Stateless Design']},
+		]
+	},
+	{
+		'id': 'module_3',
+		'title': 'Flask Framework',
+		'description': 'Building web applications with Flask',
+		'order': 3,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_3_1', 'title': 'Flask Basics', 'description': 'Setting up Flask applications', 'prerequisites': ['Web Fundamentals'], 'subtopics': ['Routes', 'Templates', 'Request/Response', 'Flask App Structure']},
+			{'id': 'topic_3_2', 'title': 'RESTful API Development', 'description': 'Creating APIs with Flask', 'prerequisites': ['Flask Basics'], 'subtopics': ['API Endpoints', 'JSON Responses', 'Error Handling', 'API Documentation']},
+			{'id': 'topic_3_3', 'title': 'Request Validation', 'description': 'Validating and sanitizing inputs', 'prerequisites': ['RESTful API Development'], 'subtopics': ['Input Validation', 'Data Sanitization', 'Error Messages', 'Security']},
+		]
+	},
+	{
+		'id': 'module_4',
+		'title': 'Database Integration',
+		'description': 'Working with databases',
+		'order': 4,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_4_1', 'title': 'SQL Fundamentals', 'description': 'Querying relational databases', 'prerequisites': [], 'subtopics': ['SELECT Queries', 'JOINs', 'Aggregations', 'Subqueries']},
+			{'id': 'topic_4_2', 'title': 'SQLAlchemy ORM', 'description': 'Object-Relational Mapping', 'prerequisites': ['SQL Fundamentals'], 'subtopics': ['Models', 'Sessions', 'Queries', 'Relationships']},
+			{'id': 'topic_4_3', 'title': 'Database Design', 'description': 'Schema design and normalization', 'prerequisites': ['SQLAlchemy ORM'], 'subtopics': ['ER Diagrams', 'Normalization', 'Indexes', 'Constraints']},
+		]
+	},
+	{
+		'id': 'module_5',
+		'title': 'Authentication & Security',
+		'description': 'Securing backend applications',
+		'order': 5,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_5_1', 'title': 'Password Security', 'description': 'Hashing and storing passwords', 'prerequisites': ['Database Integration'], 'subtopics': ['Password Hashing', 'bcrypt', 'Salt', 'Best Practices']},
+			{'id': 'topic_5_2', 'title': 'JWT Authentication', 'description': 'Token-based authentication', 'prerequisites': ['Password Security'], 'subtopics': ['JWT Basics', 'Token Generation', 'Token Verification', 'Refresh Tokens']},
+			{'id': 'topic_5_3', 'title': 'API Security', 'description': 'Protecting APIs', 'prerequisites': ['JWT Authentication'], 'subtopics': ['CORS', 'Rate Limiting', 'Input Validation', 'SQL Injection Prevention']},
+		]
+	},
+	{
+		'id': 'module_6',
+		'title': 'Advanced Backend Topics',
+		'description': 'Scaling and optimization',
+		'order': 6,
+		'difficulty': 'advanced',
+		'topics': [
+			{'id': 'topic_6_1', 'title': 'Caching Strategies', 'description': 'Improving performance with caching', 'prerequisites': ['API Security'], 'subtopics': ['Redis', 'Cache Patterns', 'Cache Invalidation', 'Performance']},
+			{'id': 'topic_6_2', 'title': 'Message Queues', 'description': 'Asynchronous task processing', 'prerequisites': ['Caching Strategies'], 'subtopics': ['RabbitMQ', 'Celery', 'Task Queues', 'Background Jobs']},
+			{'id': 'topic_6_3', 'title': 'Microservices Architecture', 'description': 'Building distributed systems', 'prerequisites': ['Message Queues'], 'subtopics': ['Service Design', 'API Gateway', 'Service Communication', 'Deployment']},
+		]
+	},
+]
+
+_BACKEND_ADVANCED_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Advanced Backend Patterns',
+		'description': 'Advanced backend development techniques',
+		'order': 1,
+		'difficulty': 'advanced',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Design Patterns', 'description': 'Backend design patterns', 'prerequisites': [], 'subtopics': ['Singleton', 'Factory', 'Observer', 'Strategy']},
+			{'id': 'topic_1_2', 'title': 'Performance Optimization', 'description': 'Optimizing backend performance', 'prerequisites': ['Design Patterns'], 'subtopics': ['Profiling', 'Database Optimization', 'Caching', 'Load Balancing']},
+		]
+	},
+]
+
+
+_DS_BEGINNER_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Python for Data Science',
+		'description': 'Python fundamentals for data analysis',
+		'order': 1,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Python Basics', 'description': 'Core Python programming', 'prerequisites': [], 'subtopics': ['Variables', 'Data Types', 'Control Flow', 'Functions']},
+			{'id': 'topic_1_2', 'title': 'NumPy Fundamentals', 'description': 'Numerical computing with NumPy', 'prerequisites': ['Python Basics'], 'subtopics': ['Arrays', 'Operations', 'Indexing', 'Broadcasting']},
+			{'id': 'topic_1_3', 'title': 'Pandas Basics', 'description': 'Data manipulation with Pandas', 'prerequisites': ['NumPy Fundamentals'], 'subtopics': ['DataFrames', 'Series', 'Data Cleaning', 'Filtering']},
+		]
+	},
+	{
+		'id': 'module_2',
+		'title': 'Data Analysis',
+		'description': 'Analyzing and exploring data',
+		'order': 2,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_2_1', 'title': 'Data Exploration', 'description': 'Understanding your data', 'prerequisites': ['Pandas Basics'], 'subtopics': ['Descriptive Statistics', 'Data Types', 'Missing Values', 'Outliers']},
+			{'id': 'topic_2_2', 'title': 'Data Visualization', 'description': 'Visualizing data insights', 'prerequisites': ['Data Exploration'], 'subtopics': ['Matplotlib', 'Seaborn', 'Plot Types', 'Customization']},
+		]
+	},
+	{
+		'id': 'module_3',
+		'title': 'Statistics Fundamentals',
+		'description': 'Statistical concepts for data science',
+		'order': 3,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_3_1', 'title': 'Descriptive Statistics', 'description': 'Measures of central tendency', 'prerequisites': [], 'subtopics': ['Mean', 'Median', 'Mode', 'Variance', 'Standard Deviation']},
+			{'id': 'topic_3_2', 'title': 'Probability', 'description': 'Probability theory basics', 'prerequisites': ['Descriptive Statistics'], 'subtopics': ['Probability Distributions', 'Bayes Theorem', 'Random Variables']},
+			{'id': 'topic_3_3', 'title': 'Inferential Statistics', 'description': 'Making inferences from data', 'prerequisites': ['Probability'], 'subtopics': ['Hypothesis Testing', 'Confidence Intervals', 'P-values', 'Statistical Tests']},
+		]
+	},
+	{
+		'id': 'module_4',
+		'title': 'Machine Learning Basics',
+		'description': 'Introduction to machine learning',
+		'order': 4,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_4_1', 'title': 'ML Fundamentals', 'description': 'Core ML concepts', 'prerequisites': ['Statistics Fundamentals'], 'subtopics': ['Supervised Learning', 'Unsupervised Learning', 'Training/Testing', 'Overfitting']},
+			{'id': 'topic_4_2', 'title': 'Linear Regression', 'description': 'Predicting continuous values', 'prerequisites': ['ML Fundamentals'], 'subtopics': ['Simple Regression', 'Multiple Regression', 'Evaluation Metrics', 'Scikit-learn']},
+			{'id': 'topic_4_3', 'title': 'Classification', 'description': 'Predicting categories', 'prerequisites': ['Linear Regression'], 'subtopics': ['Logistic Regression', 'Decision Trees', 'Random Forest', 'Evaluation']},
+		]
+	},
+]
+
+_DS_ADVANCED_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Advanced Machine Learning',
+		'description': 'Advanced ML techniques',
+		'order': 1,
+		'difficulty': 'advanced',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Deep Learning', 'description': 'Neural networks and deep learning', 'prerequisites': [], 'subtopics': ['Neural Networks', 'TensorFlow', 'Keras', 'CNNs']},
+		]
+	},
+]
+
+_MOBILE_BEGINNER_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Mobile Development Fundamentals',
+		'description': 'Introduction to mobile app development',
+		'order': 1,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Mobile App Architecture', 'description': 'Understanding mobile app structure', 'prerequisites': [], 'subtopics': ['App Lifecycle', 'Navigation', 'State Management', 'Platform Differences']},
+			{'id': 'topic_1_2', 'title': 'React Native Basics', 'description': 'Building cross-platform apps', 'prerequisites': ['Mobile App Architecture'], 'subtopics': ['Components', 'Props', 'State', 'Styling']},
+			{'id': 'topic_1_3', 'title': 'Navigation', 'description': 'App navigation patterns', 'prerequisites': ['React Native Basics'], 'subtopics': ['React Navigation', 'Stack Navigator', 'Tab Navigator', 'Deep Linking']},
+		]
+	},
+	{
+		'id': 'module_2',
+		'title': 'State Management',
+		'description': 'Managing app state',
+		'order': 2,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_2_1', 'title': 'Context API', 'description': 'React Context for state', 'prerequisites': ['Navigation'], 'subtopics': ['Context Creation', 'Providers', 'Consumers', 'Best Practices']},
+			{'id': 'topic_2_2', 'title': 'Redux', 'description': 'Advanced state management', 'prerequisites': ['Context API'], 'subtopics': ['Store', 'Actions', 'Reducers', 'Middleware']},
+		]
+	},
+	{
+		'id': 'module_3',
+		'title': 'Native Features',
+		'description': 'Accessing device features',
+		'order': 3,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_3_1', 'title': 'Camera & Media', 'description': 'Working with camera and media', 'prerequisites': ['State Management'], 'subtopics': ['Camera Access', 'Image Picker', 'Video Recording', 'Media Library']},
+			{'id': 'topic_3_2', 'title': 'Location Services', 'description': 'GPS and location features', 'prerequisites': ['Camera & Media'], 'subtopics': ['Geolocation', 'Maps Integration', 'Location Tracking']},
+			{'id': 'topic_3_3', 'title': 'Push Notifications', 'description': 'Sending notifications', 'prerequisites': ['Location Services'], 'subtopics': ['Local Notifications', 'Remote Notifications', 'Notification Handling']},
+		]
+	},
+]
+
+_MOBILE_ADVANCED_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Advanced Mobile Development',
+		'description': 'Advanced mobile app techniques',
+		'order': 1,
+		'difficulty': 'advanced',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Performance Optimization', 'description': 'Optimizing mobile apps', 'prerequisites': [], 'subtopics': ['Memory Management', 'Bundle Size', 'Rendering Optimization']},
+		]
+	},
+]
+
+_DEVOPS_BEGINNER_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Linux & Command Line',
+		'description': 'Mastering the command line',
+		'order': 1,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Linux Basics', 'description': 'Linux fundamentals', 'prerequisites': [], 'subtopics': ['File System', 'Permissions', 'Processes', 'Package Management']},
+			{'id': 'topic_1_2', 'title': 'Shell Scripting', 'description': 'Automating tasks with scripts', 'prerequisites': ['Linux Basics'], 'subtopics': ['Bash Scripts', 'Variables', 'Loops', 'Functions']},
+		]
+	},
+	{
+		'id': 'module_2',
+		'title': 'Version Control',
+		'description': 'Git and version control',
+		'order': 2,
+		'difficulty': 'beginner',
+		'topics': [
+			{'id': 'topic_2_1', 'title': 'Git Fundamentals', 'description': 'Version control basics', 'prerequisites': [], 'subtopics': ['Commits', 'Branches', 'Merging', 'Remote Repositories']},
+			{'id': 'topic_2_2', 'title': 'Git Workflows', 'description': 'Collaborative workflows', 'prerequisites': ['Git Fundamentals'], 'subtopics': ['Feature Branches', 'Pull Requests', 'Code Review', 'Merge Strategies']},
+		]
+	},
+	{
+		'id': 'module_3',
+		'title': 'Containerization',
+		'description': 'Docker and containers',
+		'order': 3,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_3_1', 'title': 'Docker Basics', 'description': 'Container fundamentals', 'prerequisites': ['Version Control'], 'subtopics': ['Images', 'Containers', 'Dockerfile', 'Docker Compose']},
+			{'id': 'topic_3_2', 'title': 'Container Orchestration', 'description': 'Managing containers at scale', 'prerequisites': ['Docker Basics'], 'subtopics': ['Docker Swarm', 'Kubernetes Basics', 'Pods', 'Services']},
+		]
+	},
+	{
+		'id': 'module_4',
+		'title': 'CI/CD Pipelines',
+		'description': 'Continuous integration and deployment',
+		'order': 4,
+		'difficulty': 'intermediate',
+		'topics': [
+			{'id': 'topic_4_1', 'title': 'CI/CD Concepts', 'description': 'Understanding CI/CD', 'prerequisites': ['Containerization'], 'subtopics': ['Continuous Integration', 'Continuous Deployment', 'Pipeline Stages', 'Best Practices']},
+			{'id': 'topic_4_2', 'title': 'GitHub Actions', 'description': 'Automating workflows', 'prerequisites': ['CI/CD Concepts'], 'subtopics': ['Workflows', 'Actions', 'Secrets', 'Deployment']},
+		]
+	},
+]
+
+_DEVOPS_ADVANCED_MODULES = [
+	{
+		'id': 'module_1',
+		'title': 'Advanced DevOps',
+		'description': 'Advanced DevOps practices',
+		'order': 1,
+		'difficulty': 'advanced',
+		'topics': [
+			{'id': 'topic_1_1', 'title': 'Kubernetes Advanced', 'description': 'Advanced Kubernetes', 'prerequisites': [], 'subtopics': ['Deployments', 'Services', 'Ingress', 'Helm']},
+		]
+	},
+]
+
+
+
+# Resource templates shared across all topics. '{n}' is the topic title and
+# '{s}' its URL slug; each template is gated on the (lowercased) content
+# preferences that activate it. Templates are read-only views so every
+# call shares the same backing dicts instead of rebuilding them.
+_RESOURCE_TEMPLATES = (
+	(frozenset(('videos',)), MappingProxyType({
+		'type': 'video',
+		'title': '{n} - Complete Tutorial',
+		'url': 'https://youtube.com/search?q={s}+tutorial',
+		'duration': '2-3 hours',
+		'platform': 'YouTube'
+	})),
+	(frozenset(('articles',)), MappingProxyType({
+		'type': 'article',
+		'title': 'Understanding {n}',
+		'url': 'https://developer.mozilla.org/en-US/search?q={s}',
+		'duration': '30-45 min read',
+		'platform': 'MDN Docs'
+	})),
+	(frozenset(('interactive', 'interactive coding')), MappingProxyType({
+		'type': 'interactive',
+		'title': '{n} - Interactive Exercises',
+		'url': 'https://www.freecodecamp.org/learn',
+		'duration': '1-2 hours',
+		'platform': 'FreeCodeCamp'
+	})),
+)
+
+
+# The documentation entry is attached to every topic regardless of
+# preferences; only its title varies, so the constant fields live in one
+# shared frozen dict spread per topic.
+_DOC_RESOURCE = MappingProxyType({
+	'type': 'documentation',
+	'url': '#',
+	'duration': 'Reference',
+	'platform': 'Official Documentation'
+})
+
+
+# Global skill-id space backing the prerequisite bitmasks; ids are handed
+# out as curriculum templates register their prerequisite strings
+_SKILL_ID_BY_NAME = {}
+
+
+def _skill_id(name):
+	"""Stable bit index for a (lowercased) skill name"""
+	return _SKILL_ID_BY_NAME.setdefault(name, len(_SKILL_ID_BY_NAME))
+
+
+def _user_skill_mask(current_skills_lower):
+	"""Fold a user's (lowercased) skills into one prerequisite bitmask"""
+	user_mask = 0
+	for skill in current_skills_lower:
+		skill_id = _SKILL_ID_BY_NAME.get(skill)
+		if skill_id is not None:
+			user_mask |= 1 << skill_id
+	return user_mask
+
+
+def _annotate_prereq_masks(curriculum):
+	"""Encode each topic's prerequisites as a bitmask over skill ids.
+
+	Also freezes each topic's string-list fields into tuples: deepcopy
+	returns tuples of immutables by reference, so every curriculum copied
+	from the template shares them instead of re-allocating the lists.
+
+	Prerequisite titles that name another topic of the same curriculum
+	are additionally resolved to ids (None when the prerequisite is an
+	outside skill), so the recommender never has to rebuild the title-to-
+	id map for paths generated from these templates.
+	"""
+	title_to_id = {t['title']: t['id']
+				for m in curriculum['modules'] for t in m['topics']}
+	for module in curriculum['modules']:
+		for topic in module['topics']:
+			mask = 0
+			for prereq in topic.get('prerequisites', ()):
+				mask |= 1 << _skill_id(prereq.lower())
+			topic['_prereq_mask'] = mask
+			topic['prerequisites'] = tuple(topic.get('prerequisites', ()))
+			topic['subtopics'] = tuple(topic.get('subtopics', ()))
+			topic['prerequisite_ids'] = tuple(title_to_id.get(p) for p in topic['prerequisites'])
+			# Resolve optional fields up front so downstream hot loops can
+			# index directly instead of paying .get-with-default per access
+			topic.setdefault('locked', False)
+			topic.setdefault('estimated_hours', 3)
+
+
+# Fallback role matcher for keys missing from the alias dispatch table.
+# One compiled alternation scan replaces the old chain of substring tests;
+# each group name is the canonical dispatch key for the matched role.
+_ROLE_FALLBACK_RE = re.compile(
+	r'(?P<fullstack>fullstack|full_stack)'
+	r'|(?P<frontend>frontend)'
+	r'|(?P<backend>backend)'
+	r'|(?P<data_science>data)'
+	r'|(?P<mobile>mobile)'
+	r'|(?P<machine_learning_engineer>machine_learning|ml)'
+	r'|(?P<ai_engineer>ai)'
+	r'|(?P<devops>devops)'
+)
+
+
+# Single-pass URL slug translation; str.translate walks the string once
+# through a C-level table instead of one scan per replace call
+_SLUG_TABLE = str.maketrans({' ': '+'})
+
+
+@functools.lru_cache(maxsize=512)
+def _topic_slug(topic_name):
+	"""URL slug for a topic title, cached since titles come from templates"""
+	return topic_name.translate(_SLUG_TABLE)
+
+
+def _materialize_template(template):
+	"""Fresh mutable copy of a cached curriculum template.
+
+	Only the dicts and topics lists are copied; every leaf value
+	(strings, tuples, masks) is shared by reference with the template,
+	which is all the finalize pass needs in order to mutate safely. This
+	is cheaper than deepcopy, which walks every leaf through its memo
+	table.
+	"""
+	curriculum = dict(template)
+	curriculum['modules'] = [
+		{**module, 'topics': [dict(topic) for topic in module['topics']]}
+		for module in template['modules']
+	]
+	return curriculum
+
+
+def _compile_resource_factories(preferred_set):
+	"""Select the resource templates active for a preference set"""
+	return [template for gates, template in _RESOURCE_TEMPLATES
+			if not preferred_set.isdisjoint(gates)]
+
+
+def _fill_resource_templates(factories, topic_name):
+	"""Materialize resource dicts for one topic from prepared templates"""
+	slug = _topic_slug(topic_name)
+	filled = [
+		{**template,
+		 'title': template['title'].format(n=topic_name),
+		 'url': template['url'].format(s=slug)}
+		for template in factories
+	]
+	filled.append({**_DOC_RESOURCE, 'title': f'{topic_name} Official Docs'})
+	return tuple(filled)
+
 
 class AIPathGenerator:
 	"""
@@ -16,7 +791,53 @@ class AIPathGenerator:
 		self.skill_hierarchy = self.load_skill_hierarchy()
 		self.curriculum_templates = self.load_curriculum_templates()
 		self.learning_resources = self.load_learning_resources()
-		
+		# Precompute per-role required-skill tuples (plus lowercased twins)
+		# so gap analysis does set lookups instead of nested list scans
+		self._required_skills_by_role = {
+			role: tuple(itertools.chain(*levels.values()))
+			for role, levels in self.skill_hierarchy.items()
+		}
+		self._required_skills_lower_by_role = {
+			role: tuple(s.lower() for s in skills)
+			for role, skills in self._required_skills_by_role.items()
+		}
+		# Fuzzy skill matching state ("React.js" still counts as "React").
+		# Built lazily on first use so importing this module stays cheap.
+		self._skill_vectorizer = None
+		self._skill_matrix = None
+		self._skill_rows_by_role = None
+		self._skill_match_threshold = 0.7
+		# Batch RNG for time estimates; much cheaper than stdlib random
+		# when drawing one value per topic
+		self._rng = np.random.default_rng()
+		# O(1) role dispatch: normalized role key -> (generator, template
+		# overrides). Unlisted keys fall back to the substring scan.
+		_ml_overrides = {'title': 'Machine Learning Engineer Path', 'target_role': 'Machine Learning Engineer'}
+		_ai_overrides = {'title': 'AI Engineer Path', 'target_role': 'AI Engineer'}
+		self._role_dispatch = {
+			'fullstack': (self.generate_fullstack_curriculum, None),
+			'full_stack_developer': (self.generate_fullstack_curriculum, None),
+			'frontend': (self.generate_frontend_curriculum, None),
+			'frontend_developer': (self.generate_frontend_curriculum, None),
+			'backend': (self.generate_backend_curriculum, None),
+			'backend_developer': (self.generate_backend_curriculum, None),
+			'data_science': (self.generate_datascience_curriculum, None),
+			'data_scientist': (self.generate_datascience_curriculum, None),
+			'mobile': (self.generate_mobile_curriculum, None),
+			'mobile_app_developer': (self.generate_mobile_curriculum, None),
+			'machine_learning_engineer': (self.generate_datascience_curriculum, _ml_overrides),
+			'ml_engineer': (self.generate_datascience_curriculum, _ml_overrides),
+			'ai_engineer': (self.generate_datascience_curriculum, _ai_overrides),
+			'devops': (self.generate_devops_curriculum, None),
+			'devops_engineer': (self.generate_devops_curriculum, None),
+		}
+		# Warm every (role, proficiency) template up front so request paths
+		# only ever deep-copy prebuilt structures; the key space is small
+		# and fixed, which is why the template caches are unbounded.
+		for role_key in self._role_dispatch:
+			for proficiency in ('beginner', 'intermediate', 'advanced'):
+				self._template_numeric_view(role_key, proficiency)
+
 	def load_skill_hierarchy(self):
 		"""Load skill dependency tree and prerequisites"""
 		return {
@@ -79,61 +900,160 @@ class AIPathGenerator:
 		Returns:
 			dict: Complete curriculum with modules, topics, resources
 		"""
-		
-		# 1. Analyze skill gaps
-		skill_gaps = self.analyze_skill_gaps(
-			user_data['current_skills'],
-			user_data['target_role']
+
+		# Generation is deterministic in this fingerprint (the estimate
+		# RNG is seeded from it), so repeat requests for the same profile
+		# are served from the memo; callers get a private deep copy since
+		# downstream code mutates the curriculum
+		key = (
+			user_data['target_role'],
+			user_data['learning_pace'],
+			float(user_data['daily_hours']),
+			int(user_data['assessment_score']),
+			frozenset(user_data['current_skills']),
+			frozenset(user_data['preferred_content']),
 		)
-		
+		if user_data.get('skip_cache'):
+			return self._generate_path(key)
+		return copy.deepcopy(self._generate_path_cached(key))
+
+	@functools.lru_cache(maxsize=2048)
+	def _generate_path_cached(self, key):
+		return self._generate_path(key)
+
+	def _generate_path(self, key):
+		target_role, learning_pace, daily_hours, assessment_score, current_skills, preferred_content = key
+		self._rng = np.random.default_rng(hash(key) & 0xFFFFFFFF)
+
+		# 1. Analyze skill gaps
+		skill_gaps = self.analyze_skill_gaps(current_skills, target_role)
+
 		# 2. Determine proficiency level
-		proficiency = self.determine_proficiency_level(
-			user_data['current_skills'],
-			user_data['assessment_score']
-		)
-		
+		proficiency = self.determine_proficiency_level(current_skills, assessment_score)
+
 		# 3. Generate curriculum structure
 		curriculum = self.build_curriculum(
-			target_role=user_data['target_role'],
+			target_role=target_role,
 			skill_gaps=skill_gaps,
 			proficiency=proficiency,
-			learning_pace=user_data['learning_pace']
+			learning_pace=learning_pace
 		)
-		
-		# 4. Optimize learning sequence
-		optimized_curriculum = self.optimize_learning_sequence(
+
+		# 4-6. Fused finalize pass: unlock checks, resources and time
+		# estimates in a single walk over the topics instead of three
+		final_curriculum = self._finalize(
 			curriculum,
-			user_data['current_skills']
-		)
-		
-		# 5. Add personalized resources
-		enriched_curriculum = self.add_personalized_resources(
-			optimized_curriculum,
-			user_data['preferred_content']
-		)
-		
-		# 6. Calculate time estimates
-		final_curriculum = self.calculate_time_estimates(
-			enriched_curriculum,
-			user_data['daily_hours'],
-			proficiency
+			current_skills=current_skills,
+			preferred_content=preferred_content,
+			daily_hours=daily_hours,
+			proficiency=proficiency
 		)
-		
+
 		return final_curriculum
+
+	def generate_paths_batch(self, user_data_list):
+		"""
+		Generate paths for a batch of users in parallel
+
+		Path generation is CPU-bound dict construction, so bursts are
+		fanned out over a process pool to sidestep the GIL; the pool is
+		created on first use and each worker runs its own generator
+		singleton.
+		"""
+		if len(user_data_list) <= 1:
+			return [self.generate_personalized_path(u) for u in user_data_list]
+		global _path_pool
+		if _path_pool is None:
+			_path_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+		return list(_path_pool.map(_generate_one, user_data_list, chunksize=8))
+
+	def _finalize(self, curriculum, current_skills, preferred_content, daily_hours, proficiency):
+		"""Decorate a freshly built curriculum in one pass.
+
+		Fuses the work of optimize_learning_sequence,
+		add_personalized_resources and calculate_time_estimates so every
+		topic dict is touched exactly once.
+		"""
+		current_skills_lower = frozenset(map(str.lower, current_skills))
+		user_mask = _user_skill_mask(current_skills_lower)
+
+		preferred_set = frozenset(p.lower() for p in preferred_content)
+		factories = _compile_resource_factories(preferred_set)
+
+		multiplier = {'beginner': 1.5, 'intermediate': 1.0, 'advanced': 0.7}.get(proficiency, 1.0)
+		modules = curriculum['modules']
+		numeric = curriculum.pop('_numeric', None)
+		if numeric is None:
+			counts = np.array([len(m['topics']) for m in modules], dtype=np.int32)
+			offsets = np.zeros(len(counts), dtype=np.int32)
+			np.cumsum(counts[:-1], out=offsets[1:])
+			numeric = {'mod_offsets': offsets, 'n_topics': int(counts.sum())}
+
+		adjusted = self._rng.integers(2, 9, size=numeric['n_topics']) * float(multiplier)
+		rounded = np.round(adjusted, 1).tolist()
+		module_totals = np.add.reduceat(adjusted, numeric['mod_offsets']) if numeric['n_topics'] else np.zeros(len(modules))
+
+		total_weeks = 0
+		index = 0
+
+		for module, module_hours in zip(modules, module_totals.tolist()):
+			for topic in module['topics']:
+				mask = topic.pop('_prereq_mask', None)
+				if mask is None:
+					prerequisites = topic.get('prerequisites', [])
+					topic['locked'] = not all(p.lower() in current_skills_lower for p in prerequisites)
+				else:
+					topic['locked'] = bool(mask & ~user_mask)
+				topic['resources'] = _fill_resource_templates(factories, topic['title'])
+				topic['estimated_hours'] = rounded[index]
+				index += 1
+
+			module['estimated_hours'] = round(module_hours, 1)
+			module['estimated_days'] = int(module_hours / daily_hours) if daily_hours > 0 else 0
+			total_weeks += (module_hours / daily_hours / 7) if daily_hours > 0 else 0
+
+		curriculum['total_estimated_weeks'] = int(total_weeks)
+		curriculum['total_estimated_hours'] = sum(m['estimated_hours'] for m in modules)
+
+		return curriculum
 	
+	def _ensure_skill_matrix(self):
+		"""Fit the char-ngram TF-IDF skill matrix on first use"""
+		if self._skill_vectorizer is not None:
+			return
+		from sklearn.feature_extraction.text import TfidfVectorizer
+
+		all_skills = sorted({s for skills in self._required_skills_by_role.values() for s in skills})
+		self._skill_vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 5))
+		self._skill_matrix = self._skill_vectorizer.fit_transform(all_skills)
+		skill_row = {s: i for i, s in enumerate(all_skills)}
+		self._skill_rows_by_role = {
+			role: np.array([skill_row[s] for s in skills], dtype=np.intp)
+			for role, skills in self._required_skills_by_role.items()
+		}
+
 	def analyze_skill_gaps(self, current_skills, target_role):
 		"""Identify missing skills needed for target role"""
 		role_key = target_role.lower().replace(' ', '_')
-		required_skills = []
-		
-		if role_key in self.skill_hierarchy:
-			for level in ['beginner', 'intermediate', 'advanced']:
-				required_skills.extend(self.skill_hierarchy[role_key][level])
-		
-		# Skills user needs to learn
-		current_skills_lower = [s.lower() for s in current_skills]
-		gaps = [skill for skill in required_skills 
-				if skill.lower() not in current_skills_lower]
+		required_skills = self._required_skills_by_role.get(role_key, ())
+		required_lower = self._required_skills_lower_by_role.get(role_key, ())
+
+		# Skills user needs to learn: exact lowercased match, backed by one
+		# batched TF-IDF cosine-similarity call for near-miss spellings
+		current_set = frozenset(map(str.lower, current_skills))
+		if current_skills and required_skills:
+			from sklearn.metrics.pairwise import cosine_similarity
+
+			self._ensure_skill_matrix()
+			user_vec = self._skill_vectorizer.transform(current_skills)
+			rows = self._skill_rows_by_role[role_key]
+			sims = cosine_similarity(user_vec, self._skill_matrix[rows])
+			fuzzy_known = sims.max(axis=0) >= self._skill_match_threshold
+			gaps = [skill for skill, lower, known in zip(required_skills, required_lower, fuzzy_known)
+					if lower not in current_set and not known]
+		else:
+			gaps = [skill for skill, lower in zip(required_skills, required_lower)
+					if lower not in current_set]
 		
 		return {
 			'missing_skills': gaps,
@@ -155,105 +1075,101 @@ class AIPathGenerator:
 	
 	def build_curriculum(self, target_role, skill_gaps, proficiency, learning_pace):
 		"""Build structured curriculum with modules and topics"""
-		
-		role_key = target_role.lower().replace(' ', '_')
-		
-		# Get base curriculum template - each career path has unique curriculum
-		if role_key == 'fullstack' or role_key == 'full_stack_developer':
-			curriculum = self.generate_fullstack_curriculum(proficiency)
-		elif role_key == 'frontend' or 'frontend' in role_key:
-			curriculum = self.generate_frontend_curriculum(proficiency)
-		elif role_key == 'backend' or 'backend' in role_key:
-			curriculum = self.generate_backend_curriculum(proficiency)
-		elif 'data' in role_key or role_key == 'data_scientist':
-			curriculum = self.generate_datascience_curriculum(proficiency)
-		elif 'mobile' in role_key or role_key == 'mobile_app_developer':
-			curriculum = self.generate_mobile_curriculum(proficiency)
-		elif 'machine_learning' in role_key or 'ml' in role_key:
-			# ML Engineer uses data science curriculum with ML focus
-			curriculum = self.generate_datascience_curriculum(proficiency)
-			curriculum['title'] = 'Machine Learning Engineer Path'
-			curriculum['target_role'] = 'Machine Learning Engineer'
-		elif 'ai' in role_key or role_key == 'ai_engineer':
-			# AI Engineer uses data science curriculum with AI focus
-			curriculum = self.generate_datascience_curriculum(proficiency)
-			curriculum['title'] = 'AI Engineer Path'
-			curriculum['target_role'] = 'AI Engineer'
-		elif 'devops' in role_key:
-			curriculum = self.generate_devops_curriculum(proficiency)
-		else:
-			# Default to fullstack if role not recognized
-			curriculum = self.generate_fullstack_curriculum(proficiency)
-		
+
+		role_key = self._canonical_role_key(target_role.lower().replace(' ', '_'))
+
+		# Templates only vary by (role, proficiency), so build each one once
+		# and hand back a private structural copy instead of re-running the
+		# generator methods on every request
+		curriculum = _materialize_template(self._curriculum_template(role_key, proficiency))
+
+		# Attach the cached struct-of-arrays view (module offsets / topic
+		# count) used by calculate_time_estimates; popped before the
+		# curriculum is serialized
+		curriculum['_numeric'] = self._template_numeric_view(role_key, proficiency)
+		return curriculum
+
+	@functools.lru_cache(maxsize=None)
+	def _template_numeric_view(self, role_key, proficiency):
+		"""Module boundary offsets and topic count for a cached template"""
+		template = self._curriculum_template(role_key, proficiency)
+		counts = np.array([len(m['topics']) for m in template['modules']], dtype=np.int32)
+		offsets = np.zeros(len(counts), dtype=np.int32)
+		np.cumsum(counts[:-1], out=offsets[1:])
+		return {'mod_offsets': offsets, 'n_topics': int(counts.sum())}
+
+	def _canonical_role_key(self, role_key):
+		"""Collapse a raw role key onto the fixed dispatch-key space.
+
+		Runs before the template cache lookups so user-supplied role
+		strings can't grow the unbounded caches: keys missing from the
+		alias table fold onto their fallback group via one compiled scan
+		(the matched group name doubles as the canonical dispatch key),
+		and unrecognized roles default to fullstack.
+		"""
+		if role_key in self._role_dispatch:
+			return role_key
+		match = _ROLE_FALLBACK_RE.search(role_key)
+		return match.lastgroup if match else 'fullstack'
+
+	@functools.lru_cache(maxsize=None)
+	def _curriculum_template(self, role_key, proficiency):
+		"""Build (and cache) the base curriculum template for a role.
+
+		role_key must already be canonical (see _canonical_role_key);
+		that keeps this cache's key space exactly the alias table.
+		"""
+		generator, overrides = self._role_dispatch[role_key]
+		curriculum = generator(proficiency)
+		if overrides:
+			# Generators memoize their output, so role overrides go on
+			# a fresh top-level dict rather than the shared one
+			curriculum = {**curriculum, **overrides}
+
+		# Precompute prerequisite bitmasks once per template so the
+		# per-request unlock check is a single AND per topic
+		_annotate_prereq_masks(curriculum)
 		return curriculum
 	
 	def optimize_learning_sequence(self, curriculum, current_skills):
 		"""Optimize topic sequence based on prerequisites and dependencies"""
-		# Mark topics as unlocked if prerequisites are met
-		current_skills_lower = [s.lower() for s in current_skills]
-		
+		# Mark topics as unlocked if prerequisites are met. The user's
+		# skills fold into one bitmask, so each topic check is a single
+		# AND + compare instead of per-prerequisite string work
+		current_skills_lower = frozenset(map(str.lower, current_skills))
+		user_mask = _user_skill_mask(current_skills_lower)
+
 		for module in curriculum['modules']:
 			for topic in module['topics']:
-				prerequisites = topic.get('prerequisites', [])
-				prereqs_met = all(p.lower() in current_skills_lower for p in prerequisites)
-				topic['locked'] = not prereqs_met
+				mask = topic.pop('_prereq_mask', None)
+				if mask is None:
+					# Curriculum built outside the template cache
+					prerequisites = topic.get('prerequisites', [])
+					topic['locked'] = not all(p.lower() in current_skills_lower for p in prerequisites)
+				else:
+					topic['locked'] = bool(mask & ~user_mask)
 		
 		return curriculum
 	
 	def add_personalized_resources(self, curriculum, preferred_content):
 		"""Add learning resources based on user preferences"""
+		# Normalize preferences and pick the active templates once for the
+		# whole curriculum instead of re-checking them per topic
+		preferred_set = frozenset(p.lower() for p in preferred_content)
+		factories = _compile_resource_factories(preferred_set)
+
 		for module in curriculum['modules']:
 			for topic in module['topics']:
-				topic['resources'] = self.fetch_resources_for_topic(
-					topic['title'],
-					preferred_content
-				)
-		
+				topic['resources'] = _fill_resource_templates(factories, topic['title'])
+
 		return curriculum
-	
+
 	def fetch_resources_for_topic(self, topic_name, preferred_content):
 		"""Fetch curated resources for a specific topic"""
 		# In production, this would query a resource database
 		# For now, returning sample resources
-		
-		resources = []
-		
-		if 'videos' in preferred_content or 'Videos' in preferred_content:
-			resources.append({
-				'type': 'video',
-				'title': f'{topic_name} - Complete Tutorial',
-				'url': f'https://youtube.com/search?q={topic_name.replace(" ", "+")}+tutorial',
-				'duration': '2-3 hours',
-				'platform': 'YouTube'
-			})
-		
-		if 'articles' in preferred_content or 'Articles' in preferred_content:
-			resources.append({
-				'type': 'article',
-				'title': f'Understanding {topic_name}',
-				'url': f'https://developer.mozilla.org/en-US/search?q={topic_name.replace(" ", "+")}',
-				'duration': '30-45 min read',
-				'platform': 'MDN Docs'
-			})
-		
-		if 'interactive' in preferred_content or 'Interactive Coding' in preferred_content:
-			resources.append({
-				'type': 'interactive',
-				'title': f'{topic_name} - Interactive Exercises',
-				'url': f'https://www.freecodecamp.org/learn',
-				'duration': '1-2 hours',
-				'platform': 'FreeCodeCamp'
-			})
-		
-		resources.append({
-			'type': 'documentation',
-			'title': f'{topic_name} Official Docs',
-			'url': '#',
-			'duration': 'Reference',
-			'platform': 'Official Documentation'
-		})
-		
-		return resources
+		preferred_set = frozenset(p.lower() for p in preferred_content)
+		return _fill_resource_templates(_compile_resource_factories(preferred_set), topic_name)
 	
 	def calculate_time_estimates(self, curriculum, daily_hours, proficiency):
 		"""Calculate realistic time estimates for completion"""
@@ -266,22 +1182,33 @@ class AIPathGenerator:
 		}
 		
 		multiplier = multipliers.get(proficiency, 1.0)
-		
+
+		# All numeric work happens on the struct-of-arrays view: one
+		# vectorized draw for the base estimates and one reduceat for the
+		# per-module sums, written back into the dicts at the end
+		modules = curriculum['modules']
+		numeric = curriculum.pop('_numeric', None)
+		if numeric is None:
+			# Curriculum built outside build_curriculum; derive the view here
+			counts = np.array([len(m['topics']) for m in modules], dtype=np.int32)
+			offsets = np.zeros(len(counts), dtype=np.int32)
+			np.cumsum(counts[:-1], out=offsets[1:])
+			numeric = {'mod_offsets': offsets, 'n_topics': int(counts.sum())}
+
+		topics = [t for m in modules for t in m['topics']]
+		# float64 so the rounded values serialize cleanly to JSON
+		adjusted = self._rng.integers(2, 9, size=numeric['n_topics']) * float(multiplier)
+		for topic, hours in zip(topics, np.round(adjusted, 1).tolist()):
+			topic['estimated_hours'] = hours
+
+		module_totals = np.add.reduceat(adjusted, numeric['mod_offsets']) if topics else np.zeros(len(modules))
+
 		total_weeks = 0
-		
-		for module in curriculum['modules']:
-			module_hours = 0
-			
-			for topic in module['topics']:
-				# Base estimate per topic
-				base_hours = random.randint(2, 8)
-				adjusted_hours = base_hours * multiplier
-				topic['estimated_hours'] = round(adjusted_hours, 1)
-				module_hours += adjusted_hours
-			
+
+		for module, module_hours in zip(modules, module_totals.tolist()):
 			module['estimated_hours'] = round(module_hours, 1)
 			module['estimated_days'] = int(module_hours / daily_hours) if daily_hours > 0 else 0
-			
+
 			total_weeks += (module_hours / daily_hours / 7) if daily_hours > 0 else 0
 		
 		curriculum['total_estimated_weeks'] = int(total_weeks)
@@ -289,339 +1216,11 @@ class AIPathGenerator:
 		
 		return curriculum
 	
-	def generate_fullstack_curriculum(self, proficiency):
+	@staticmethod
+	@functools.lru_cache(maxsize=4)
+	def generate_fullstack_curriculum(proficiency):
 		"""Generate Full Stack Developer curriculum"""
-		
-		if proficiency == 'beginner':
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Programming Fundamentals',
-					'description': 'Core programming concepts and problem-solving',
-					'order': 1,
-					'difficulty': 'beginner',
-					'topics': [
-						{
-							'id': 'topic_1_1',
-							'title': 'Introduction to Programming',
-							'description': 'Variables, data types, and basic operations',
-							'prerequisites': [],
-							'subtopics': ['Variables', 'Data Types', 'Operators', 'Input/Output']
-						},
-						{
-							'id': 'topic_1_2',
-							'title': 'Control Structures',
-							'description': 'If statements, loops, and logical thinking',
-							'prerequisites': ['Introduction to Programming'],
-							'subtopics': ['Conditionals', 'For Loops', 'While Loops', 'Break & Continue']
-						},
-						{
-							'id': 'topic_1_3',
-							'title': 'Functions and Scope',
-							'description': 'Creating reusable code blocks',
-							'prerequisites': ['Control Structures'],
-							'subtopics': ['Function Basics', 'Parameters', 'Return Values', 'Scope']
-						},
-						{
-							'id': 'topic_1_4',
-							'title': 'Data Structures Basics',
-							'description': 'Arrays, lists, and dictionaries',
-							'prerequisites': ['Functions and Scope'],
-							'subtopics': ['Arrays', 'Lists', 'Objects', 'Iteration']
-						},
-						{
-							'id': 'topic_1_5',
-							'title': 'Version Control with Git',
-							'description': 'Managing code with Git and GitHub',
-							'prerequisites': [],
-							'subtopics': ['Git Basics', 'Commits', 'Branches', 'GitHub']
-						}
-					]
-				},
-				{
-					'id': 'module_2',
-					'title': 'Frontend Development',
-					'description': 'Building user interfaces with HTML, CSS, and JavaScript',
-					'order': 2,
-					'difficulty': 'beginner',
-					'topics': [
-						{
-							'id': 'topic_2_1',
-							'title': 'HTML5 Fundamentals',
-							'description': 'Structure web content with semantic HTML',
-							'prerequisites': [],
-							'subtopics': ['HTML Elements', 'Semantic HTML', 'Forms', 'Accessibility']
-						},
-						{
-							'id': 'topic_2_2',
-							'title': 'CSS3 Styling',
-							'description': 'Style and layout web pages',
-							'prerequisites': ['HTML5 Fundamentals'],
-							'subtopics': ['Selectors', 'Box Model', 'Flexbox', 'Grid', 'Responsive Design']
-						},
-						{
-							'id': 'topic_2_3',
-							'title': 'JavaScript for Web',
-							'description': 'Make websites interactive',
-							'prerequisites': ['CSS3 Styling', 'Functions and Scope'],
-							'subtopics': ['DOM Manipulation', 'Events', 'Form Validation', 'Async JavaScript']
-						},
-						{
-							'id': 'topic_2_4',
-							'title': 'Modern CSS',
-							'description': 'Advanced styling techniques',
-							'prerequisites': ['CSS3 Styling'],
-							'subtopics': ['Animations', 'Transitions', 'Custom Properties', 'CSS Architecture']
-						}
-					]
-				},
-				{
-					'id': 'module_3',
-					'title': 'React Framework',
-					'description': 'Build dynamic UIs with React',
-					'order': 3,
-					'difficulty': 'intermediate',
-					'topics': [
-						{
-							'id': 'topic_3_1',
-							'title': 'React Fundamentals',
-							'description': 'Components, props, and JSX',
-							'prerequisites': ['JavaScript for Web'],
-							'subtopics': ['Components', 'Props', 'JSX', 'Rendering']
-						},
-						{
-							'id': 'topic_3_2',
-							'title': 'State Management',
-							'description': 'Managing component state',
-							'prerequisites': ['React Fundamentals'],
-							'subtopics': ['useState', 'useEffect', 'Lifting State', 'Context API']
-						},
-						{
-							'id': 'topic_3_3',
-							'title': 'React Router',
-							'description': 'Navigation in React apps',
-							'prerequisites': ['State Management'],
-							'subtopics': ['Routes', 'Navigation', 'Parameters', 'Protected Routes']
-						},
-						{
-							'id': 'topic_3_4',
-							'title': 'API Integration',
-							'description': 'Fetching and displaying data',
-							'prerequisites': ['State Management'],
-							'subtopics': ['Fetch API', 'Axios', 'Loading States', 'Error Handling']
-						}
-					]
-				},
-				{
-					'id': 'module_4',
-					'title': 'Backend Development with Python',
-					'description': 'Server-side programming and APIs',
-					'order': 4,
-					'difficulty': 'intermediate',
-					'topics': [
-						{
-							'id': 'topic_4_1',
-							'title': 'Python Fundamentals',
-							'description': 'Python syntax and core concepts',
-							'prerequisites': ['Programming Fundamentals'],
-							'subtopics': ['Python Syntax', 'OOP Basics', 'Modules', 'Error Handling']
-						},
-						{
-							'id': 'topic_4_2',
-							'title': 'Flask Framework',
-							'description': 'Building web applications with Flask',
-							'prerequisites': ['Python Fundamentals'],
-							'subtopics': ['Routes', 'Templates', 'Request/Response', 'Blueprints']
-						},
-						{
-							'id': 'topic_4_3',
-							'title': 'RESTful API Design',
-							'description': 'Creating and documenting APIs',
-							'prerequisites': ['Flask Framework'],
-							'subtopics': ['REST Principles', 'HTTP Methods', 'Status Codes', 'JSON']
-						},
-						{
-							'id': 'topic_4_4',
-							'title': 'Database Integration',
-							'description': 'Working with databases',
-							'prerequisites': ['Flask Framework'],
-							'subtopics': ['SQL Basics', 'SQLAlchemy', 'CRUD Operations', 'Relationships']
-						},
-						{
-							'id': 'topic_4_5',
-							'title': 'Authentication & Security',
-							'description': 'Securing your applications',
-							'prerequisites': ['RESTful API Design', 'Database Integration'],
-							'subtopics': ['JWT', 'Password Hashing', 'CORS', 'Input Validation']
-						}
-					]
-				},
-				{
-					'id': 'module_5',
-					'title': 'Database Management',
-					'description': 'Data modeling and database operations',
-					'order': 5,
-					'difficulty': 'intermediate',
-					'topics': [
-						{
-							'id': 'topic_5_1',
-							'title': 'SQL Fundamentals',
-							'description': 'Querying relational databases',
-							'prerequisites': [],
-							'subtopics': ['SELECT Queries', 'JOINs', 'Aggregations', 'Subqueries']
-						},
-						{
-							'id': 'topic_5_2',
-							'title': 'Database Design',
-							'description': 'Schema design and normalization',
-							'prerequisites': ['SQL Fundamentals'],
-							'subtopics': ['ER Diagrams', 'Normalization', 'Indexes', 'Constraints']
-						},
-						{
-							'id': 'topic_5_3',
-							'title': 'NoSQL Databases',
-							'description': 'Document databases and MongoDB',
-							'prerequisites': ['Database Design'],
-							'subtopics': ['MongoDB Basics', 'Collections', 'Queries', 'Aggregation']
-						},
-						{
-							'id': 'topic_5_4',
-							'title': 'Database Optimization',
-							'description': 'Performance tuning',
-							'prerequisites': ['Database Design'],
-							'subtopics': ['Query Optimization', 'Indexing Strategies', 'Caching', 'Transactions']
-						}
-					]
-				},
-				{
-					'id': 'module_6',
-					'title': 'Full Stack Integration',
-					'description': 'Connecting frontend and backend',
-					'order': 6,
-					'difficulty': 'advanced',
-					'topics': [
-						{
-							'id': 'topic_6_1',
-							'title': 'Frontend-Backend Communication',
-							'description': 'Connecting React to Flask API',
-							'prerequisites': ['API Integration', 'RESTful API Design'],
-							'subtopics': ['API Calls', 'State Management', 'Error Handling', 'Loading States']
-						},
-						{
-							'id': 'topic_6_2',
-							'title': 'File Upload & Management',
-							'description': 'Handling files in full stack apps',
-							'prerequisites': ['Frontend-Backend Communication'],
-							'subtopics': ['Multer/FormData', 'File Storage', 'Image Processing', 'Cloud Storage']
-						},
-						{
-							'id': 'topic_6_3',
-							'title': 'Real-time Features',
-							'description': 'WebSockets and live updates',
-							'prerequisites': ['Frontend-Backend Communication'],
-							'subtopics': ['WebSockets', 'Socket.io', 'Real-time Notifications', 'Chat Features']
-						},
-						{
-							'id': 'topic_6_4',
-							'title': 'Testing Full Stack Apps',
-							'description': 'Unit and integration testing',
-							'prerequisites': ['Frontend-Backend Communication'],
-							'subtopics': ['Jest', 'Pytest', 'Integration Tests', 'E2E Testing']
-						}
-					]
-				},
-				{
-					'id': 'module_7',
-					'title': 'Deployment & DevOps',
-					'description': 'Deploy applications to production',
-					'order': 7,
-					'difficulty': 'advanced',
-					'topics': [
-						{
-							'id': 'topic_7_1',
-							'title': 'Cloud Platforms',
-							'description': 'Deploy to cloud services',
-							'prerequisites': ['Full Stack Integration'],
-							'subtopics': ['Heroku', 'AWS', 'DigitalOcean', 'Vercel/Netlify']
-						},
-						{
-							'id': 'topic_7_2',
-							'title': 'Docker Containerization',
-							'description': 'Package apps with Docker',
-							'prerequisites': ['Cloud Platforms'],
-							'subtopics': ['Docker Basics', 'Dockerfile', 'Docker Compose', 'Container Management']
-						},
-						{
-							'id': 'topic_7_3',
-							'title': 'CI/CD Pipelines',
-							'description': 'Automate deployment',
-							'prerequisites': ['Docker Containerization'],
-							'subtopics': ['GitHub Actions', 'Automated Testing', 'Deployment Automation', 'Rollbacks']
-						},
-						{
-							'id': 'topic_7_4',
-							'title': 'Monitoring & Logging',
-							'description': 'Application monitoring',
-							'prerequisites': ['CI/CD Pipelines'],
-							'subtopics': ['Error Tracking', 'Performance Monitoring', 'Logging', 'Analytics']
-						}
-					]
-				},
-				{
-					'id': 'module_8',
-					'title': 'Capstone Project',
-					'description': 'Build a complete full stack application',
-					'order': 8,
-					'difficulty': 'advanced',
-					'topics': [
-						{
-							'id': 'topic_8_1',
-							'title': 'Project Planning',
-							'description': 'Design your application',
-							'prerequisites': ['Deployment & DevOps'],
-							'subtopics': ['Requirements', 'Database Schema', 'API Design', 'UI Mockups']
-						},
-						{
-							'id': 'topic_8_2',
-							'title': 'Backend Implementation',
-							'description': 'Build the server and database',
-							'prerequisites': ['Project Planning'],
-							'subtopics': ['API Endpoints', 'Database Models', 'Authentication', 'Business Logic']
-						},
-						{
-							'id': 'topic_8_3',
-							'title': 'Frontend Implementation',
-							'description': 'Build the user interface',
-							'prerequisites': ['Project Planning'],
-							'subtopics': ['Components', 'State Management', 'API Integration', 'Styling']
-						},
-						{
-							'id': 'topic_8_4',
-							'title': 'Testing & Deployment',
-							'description': 'Test and deploy your app',
-							'prerequisites': ['Backend Implementation', 'Frontend Implementation'],
-							'subtopics': ['Testing', 'Bug Fixes', 'Optimization', 'Production Deployment']
-						}
-					]
-				}
-			]
-		else:
-			# For intermediate/advanced, skip basics and focus on advanced topics
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Advanced React Patterns',
-					'description': 'Advanced React techniques',
-					'order': 1,
-					'difficulty': 'advanced',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Custom Hooks', 'description': 'Create reusable logic', 'prerequisites': [], 'subtopics': []},
-						{'id': 'topic_1_2', 'title': 'Context & Performance', 'description': 'Optimize React apps', 'prerequisites': ['Custom Hooks'], 'subtopics': []},
-						{'id': 'topic_1_3', 'title': 'Advanced State Management', 'description': 'Redux, Zustand, Jotai', 'prerequisites': ['Context & Performance'], 'subtopics': []}
-					]
-				},
-				# Add more advanced modules...
-			]
+		modules = _FULLSTACK_BEGINNER_MODULES if proficiency == 'beginner' else _FULLSTACK_ADVANCED_MODULES
 		
 		return {
 			'title': 'Full Stack Developer Path',
@@ -631,24 +1230,12 @@ class AIPathGenerator:
 			'modules': modules
 		}
 	
-	def generate_frontend_curriculum(self, proficiency):
+	@staticmethod
+	@functools.lru_cache(maxsize=4)
+	def generate_frontend_curriculum(proficiency):
 		"""Generate Frontend Developer curriculum"""
 		# Similar structure to fullstack but focused on frontend
-		modules = [
-			{
-				'id': 'module_1',
-				'title': 'HTML & CSS Mastery',
-				'description': 'Master modern HTML and CSS',
-				'order': 1,
-				'difficulty': 'beginner',
-				'topics': [
-					{'id': 'topic_1_1', 'title': 'Semantic HTML5', 'description': 'Modern HTML structure', 'prerequisites': [], 'subtopics': ['Elements', 'Accessibility', 'SEO']},
-					{'id': 'topic_1_2', 'title': 'Advanced CSS', 'description': 'Flexbox, Grid, Animations', 'prerequisites': ['Semantic HTML5'], 'subtopics': ['Flexbox', 'Grid', 'Animations', 'Responsive']},
-					{'id': 'topic_1_3', 'title': 'CSS Preprocessors', 'description': 'SASS/SCSS', 'prerequisites': ['Advanced CSS'], 'subtopics': ['Variables', 'Mixins', 'Nesting']},
-				]
-			},
-			# Add more frontend modules...
-		]
+		modules = _FRONTEND_MODULES
 		
 		return {
 			'title': 'Frontend Developer Path',
@@ -658,97 +1245,11 @@ class AIPathGenerator:
 			'modules': modules
 		}
 	
-	def generate_backend_curriculum(self, proficiency):
+	@staticmethod
+	@functools.lru_cache(maxsize=4)
+	def generate_backend_curriculum(proficiency):
 		"""Generate Backend Developer curriculum"""
-		if proficiency == 'beginner':
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Programming Fundamentals',
-					'description': 'Core programming concepts with Python',
-					'order': 1,
-					'difficulty': 'beginner',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Python Basics', 'description': 'Variables, data types, and operations', 'prerequisites': [], 'subtopics': ['Variables', 'Data Types', 'Operators', 'Input/Output']},
-						{'id': 'topic_1_2', 'title': 'Control Flow', 'description': 'Conditionals and loops', 'prerequisites': ['Python Basics'], 'subtopics': ['If/Else', 'For Loops', 'While Loops', 'Break/Continue']},
-						{'id': 'topic_1_3', 'title': 'Functions & Modules', 'description': 'Creating reusable code', 'prerequisites': ['Control Flow'], 'subtopics': ['Functions', 'Parameters', 'Return Values', 'Modules']},
-						{'id': 'topic_1_4', 'title': 'Data Structures', 'description': 'Lists, dictionaries, and sets', 'prerequisites': ['Functions & Modules'], 'subtopics': ['Lists', 'Dictionaries', 'Sets', 'Tuples']},
-					]
-				},
-				{
-					'id': 'module_2',
-					'title': 'Web Fundamentals',
-					'description': 'Understanding HTTP and web protocols',
-					'order': 2,
-					'difficulty': 'beginner',
-					'topics': [
-						{'id': 'topic_2_1', 'title': 'HTTP Basics', 'description': 'Understanding HTTP protocol', 'prerequisites': [], 'subtopics': ['HTTP Methods', 'Status Codes', 'Headers', 'Request/Response']},
-						{'id': 'topic_2_2', 'title': 'REST API Concepts', 'description': 'RESTful architecture principles', 'prerequisites': ['HTTP Basics'], 'subtopics': ['REST Principles', 'Resources', 'Endpoints', 'Stateless Design']},
-					]
-				},
-				{
-					'id': 'module_3',
-					'title': 'Flask Framework',
-					'description': 'Building web applications with Flask',
-					'order': 3,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_3_1', 'title': 'Flask Basics', 'description': 'Setting up Flask applications', 'prerequisites': ['Web Fundamentals'], 'subtopics': ['Routes', 'Templates', 'Request/Response', 'Flask App Structure']},
-						{'id': 'topic_3_2', 'title': 'RESTful API Development', 'description': 'Creating APIs with Flask', 'prerequisites': ['Flask Basics'], 'subtopics': ['API Endpoints', 'JSON Responses', 'Error Handling', 'API Documentation']},
-						{'id': 'topic_3_3', 'title': 'Request Validation', 'description': 'Validating and sanitizing inputs', 'prerequisites': ['RESTful API Development'], 'subtopics': ['Input Validation', 'Data Sanitization', 'Error Messages', 'Security']},
-					]
-				},
-				{
-					'id': 'module_4',
-					'title': 'Database Integration',
-					'description': 'Working with databases',
-					'order': 4,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_4_1', 'title': 'SQL Fundamentals', 'description': 'Querying relational databases', 'prerequisites': [], 'subtopics': ['SELECT Queries', 'JOINs', 'Aggregations', 'Subqueries']},
-						{'id': 'topic_4_2', 'title': 'SQLAlchemy ORM', 'description': 'Object-Relational Mapping', 'prerequisites': ['SQL Fundamentals'], 'subtopics': ['Models', 'Sessions', 'Queries', 'Relationships']},
-						{'id': 'topic_4_3', 'title': 'Database Design', 'description': 'Schema design and normalization', 'prerequisites': ['SQLAlchemy ORM'], 'subtopics': ['ER Diagrams', 'Normalization', 'Indexes', 'Constraints']},
-					]
-				},
-				{
-					'id': 'module_5',
-					'title': 'Authentication & Security',
-					'description': 'Securing backend applications',
-					'order': 5,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_5_1', 'title': 'Password Security', 'description': 'Hashing and storing passwords', 'prerequisites': ['Database Integration'], 'subtopics': ['Password Hashing', 'bcrypt', 'Salt', 'Best Practices']},
-						{'id': 'topic_5_2', 'title': 'JWT Authentication', 'description': 'Token-based authentication', 'prerequisites': ['Password Security'], 'subtopics': ['JWT Basics', 'Token Generation', 'Token Verification', 'Refresh Tokens']},
-						{'id': 'topic_5_3', 'title': 'API Security', 'description': 'Protecting APIs', 'prerequisites': ['JWT Authentication'], 'subtopics': ['CORS', 'Rate Limiting', 'Input Validation', 'SQL Injection Prevention']},
-					]
-				},
-				{
-					'id': 'module_6',
-					'title': 'Advanced Backend Topics',
-					'description': 'Scaling and optimization',
-					'order': 6,
-					'difficulty': 'advanced',
-					'topics': [
-						{'id': 'topic_6_1', 'title': 'Caching Strategies', 'description': 'Improving performance with caching', 'prerequisites': ['API Security'], 'subtopics': ['Redis', 'Cache Patterns', 'Cache Invalidation', 'Performance']},
-						{'id': 'topic_6_2', 'title': 'Message Queues', 'description': 'Asynchronous task processing', 'prerequisites': ['Caching Strategies'], 'subtopics': ['RabbitMQ', 'Celery', 'Task Queues', 'Background Jobs']},
-						{'id': 'topic_6_3', 'title': 'Microservices Architecture', 'description': 'Building distributed systems', 'prerequisites': ['Message Queues'], 'subtopics': ['Service Design', 'API Gateway', 'Service Communication', 'Deployment']},
-					]
-				},
-			]
-		else:
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Advanced Backend Patterns',
-					'description': 'Advanced backend development techniques',
-					'order': 1,
-					'difficulty': 'advanced',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Design Patterns', 'description': 'Backend design patterns', 'prerequisites': [], 'subtopics': ['Singleton', 'Factory', 'Observer', 'Strategy']},
-						{'id': 'topic_1_2', 'title': 'Performance Optimization', 'description': 'Optimizing backend performance', 'prerequisites': ['Design Patterns'], 'subtopics': ['Profiling', 'Database Optimization', 'Caching', 'Load Balancing']},
-					]
-				},
-			]
+		modules = _BACKEND_BEGINNER_MODULES if proficiency == 'beginner' else _BACKEND_ADVANCED_MODULES
 		
 		return {
 			'title': 'Backend Developer Path',
@@ -758,71 +1259,11 @@ class AIPathGenerator:
 			'modules': modules
 		}
 	
-	def generate_datascience_curriculum(self, proficiency):
+	@staticmethod
+	@functools.lru_cache(maxsize=4)
+	def generate_datascience_curriculum(proficiency):
 		"""Generate Data Science curriculum"""
-		if proficiency == 'beginner':
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Python for Data Science',
-					'description': 'Python fundamentals for data analysis',
-					'order': 1,
-					'difficulty': 'beginner',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Python Basics', 'description': 'Core Python programming', 'prerequisites': [], 'subtopics': ['Variables', 'Data Types', 'Control Flow', 'Functions']},
-						{'id': 'topic_1_2', 'title': 'NumPy Fundamentals', 'description': 'Numerical computing with NumPy', 'prerequisites': ['Python Basics'], 'subtopics': ['Arrays', 'Operations', 'Indexing', 'Broadcasting']},
-						{'id': 'topic_1_3', 'title': 'Pandas Basics', 'description': 'Data manipulation with Pandas', 'prerequisites': ['NumPy Fundamentals'], 'subtopics': ['DataFrames', 'Series', 'Data Cleaning', 'Filtering']},
-					]
-				},
-				{
-					'id': 'module_2',
-					'title': 'Data Analysis',
-					'description': 'Analyzing and exploring data',
-					'order': 2,
-					'difficulty': 'beginner',
-					'topics': [
-						{'id': 'topic_2_1', 'title': 'Data Exploration', 'description': 'Understanding your data', 'prerequisites': ['Pandas Basics'], 'subtopics': ['Descriptive Statistics', 'Data Types', 'Missing Values', 'Outliers']},
-						{'id': 'topic_2_2', 'title': 'Data Visualization', 'description': 'Visualizing data insights', 'prerequisites': ['Data Exploration'], 'subtopics': ['Matplotlib', 'Seaborn', 'Plot Types', 'Customization']},
-					]
-				},
-				{
-					'id': 'module_3',
-					'title': 'Statistics Fundamentals',
-					'description': 'Statistical concepts for data science',
-					'order': 3,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_3_1', 'title': 'Descriptive Statistics', 'description': 'Measures of central tendency', 'prerequisites': [], 'subtopics': ['Mean', 'Median', 'Mode', 'Variance', 'Standard Deviation']},
-						{'id': 'topic_3_2', 'title': 'Probability', 'description': 'Probability theory basics', 'prerequisites': ['Descriptive Statistics'], 'subtopics': ['Probability Distributions', 'Bayes Theorem', 'Random Variables']},
-						{'id': 'topic_3_3', 'title': 'Inferential Statistics', 'description': 'Making inferences from data', 'prerequisites': ['Probability'], 'subtopics': ['Hypothesis Testing', 'Confidence Intervals', 'P-values', 'Statistical Tests']},
-					]
-				},
-				{
-					'id': 'module_4',
-					'title': 'Machine Learning Basics',
-					'description': 'Introduction to machine learning',
-					'order': 4,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_4_1', 'title': 'ML Fundamentals', 'description': 'Core ML concepts', 'prerequisites': ['Statistics Fundamentals'], 'subtopics': ['Supervised Learning', 'Unsupervised Learning', 'Training/Testing', 'Overfitting']},
-						{'id': 'topic_4_2', 'title': 'Linear Regression', 'description': 'Predicting continuous values', 'prerequisites': ['ML Fundamentals'], 'subtopics': ['Simple Regression', 'Multiple Regression', 'Evaluation Metrics', 'Scikit-learn']},
-						{'id': 'topic_4_3', 'title': 'Classification', 'description': 'Predicting categories', 'prerequisites': ['Linear Regression'], 'subtopics': ['Logistic Regression', 'Decision Trees', 'Random Forest', 'Evaluation']},
-					]
-				},
-			]
-		else:
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Advanced Machine Learning',
-					'description': 'Advanced ML techniques',
-					'order': 1,
-					'difficulty': 'advanced',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Deep Learning', 'description': 'Neural networks and deep learning', 'prerequisites': [], 'subtopics': ['Neural Networks', 'TensorFlow', 'Keras', 'CNNs']},
-					]
-				},
-			]
+		modules = _DS_BEGINNER_MODULES if proficiency == 'beginner' else _DS_ADVANCED_MODULES
 		
 		return {
 			'title': 'Data Scientist Path',
@@ -832,59 +1273,11 @@ class AIPathGenerator:
 			'modules': modules
 		}
 	
-	def generate_mobile_curriculum(self, proficiency):
+	@staticmethod
+	@functools.lru_cache(maxsize=4)
+	def generate_mobile_curriculum(proficiency):
 		"""Generate Mobile Developer curriculum"""
-		if proficiency == 'beginner':
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Mobile Development Fundamentals',
-					'description': 'Introduction to mobile app development',
-					'order': 1,
-					'difficulty': 'beginner',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Mobile App Architecture', 'description': 'Understanding mobile app structure', 'prerequisites': [], 'subtopics': ['App Lifecycle', 'Navigation', 'State Management', 'Platform Differences']},
-						{'id': 'topic_1_2', 'title': 'React Native Basics', 'description': 'Building cross-platform apps', 'prerequisites': ['Mobile App Architecture'], 'subtopics': ['Components', 'Props', 'State', 'Styling']},
-						{'id': 'topic_1_3', 'title': 'Navigation', 'description': 'App navigation patterns', 'prerequisites': ['React Native Basics'], 'subtopics': ['React Navigation', 'Stack Navigator', 'Tab Navigator', 'Deep Linking']},
-					]
-				},
-				{
-					'id': 'module_2',
-					'title': 'State Management',
-					'description': 'Managing app state',
-					'order': 2,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_2_1', 'title': 'Context API', 'description': 'React Context for state', 'prerequisites': ['Navigation'], 'subtopics': ['Context Creation', 'Providers', 'Consumers', 'Best Practices']},
-						{'id': 'topic_2_2', 'title': 'Redux', 'description': 'Advanced state management', 'prerequisites': ['Context API'], 'subtopics': ['Store', 'Actions', 'Reducers', 'Middleware']},
-					]
-				},
-				{
-					'id': 'module_3',
-					'title': 'Native Features',
-					'description': 'Accessing device features',
-					'order': 3,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_3_1', 'title': 'Camera & Media', 'description': 'Working with camera and media', 'prerequisites': ['State Management'], 'subtopics': ['Camera Access', 'Image Picker', 'Video Recording', 'Media Library']},
-						{'id': 'topic_3_2', 'title': 'Location Services', 'description': 'GPS and location features', 'prerequisites': ['Camera & Media'], 'subtopics': ['Geolocation', 'Maps Integration', 'Location Tracking']},
-						{'id': 'topic_3_3', 'title': 'Push Notifications', 'description': 'Sending notifications', 'prerequisites': ['Location Services'], 'subtopics': ['Local Notifications', 'Remote Notifications', 'Notification Handling']},
-					]
-				},
-			]
-		else:
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Advanced Mobile Development',
-					'description': 'Advanced mobile app techniques',
-					'order': 1,
-					'difficulty': 'advanced',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Performance Optimization', 'description': 'Optimizing mobile apps', 'prerequisites': [], 'subtopics': ['Memory Management', 'Bundle Size', 'Rendering Optimization']},
-					]
-				},
-			]
+		modules = _MOBILE_BEGINNER_MODULES if proficiency == 'beginner' else _MOBILE_ADVANCED_MODULES
 		
 		return {
 			'title': 'Mobile App Developer Path',
@@ -894,68 +1287,11 @@ class AIPathGenerator:
 			'modules': modules
 		}
 	
-	def generate_devops_curriculum(self, proficiency):
+	@staticmethod
+	@functools.lru_cache(maxsize=4)
+	def generate_devops_curriculum(proficiency):
 		"""Generate DevOps Engineer curriculum"""
-		if proficiency == 'beginner':
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Linux & Command Line',
-					'description': 'Mastering the command line',
-					'order': 1,
-					'difficulty': 'beginner',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Linux Basics', 'description': 'Linux fundamentals', 'prerequisites': [], 'subtopics': ['File System', 'Permissions', 'Processes', 'Package Management']},
-						{'id': 'topic_1_2', 'title': 'Shell Scripting', 'description': 'Automating tasks with scripts', 'prerequisites': ['Linux Basics'], 'subtopics': ['Bash Scripts', 'Variables', 'Loops', 'Functions']},
-					]
-				},
-				{
-					'id': 'module_2',
-					'title': 'Version Control',
-					'description': 'Git and version control',
-					'order': 2,
-					'difficulty': 'beginner',
-					'topics': [
-						{'id': 'topic_2_1', 'title': 'Git Fundamentals', 'description': 'Version control basics', 'prerequisites': [], 'subtopics': ['Commits', 'Branches', 'Merging', 'Remote Repositories']},
-						{'id': 'topic_2_2', 'title': 'Git Workflows', 'description': 'Collaborative workflows', 'prerequisites': ['Git Fundamentals'], 'subtopics': ['Feature Branches', 'Pull Requests', 'Code Review', 'Merge Strategies']},
-					]
-				},
-				{
-					'id': 'module_3',
-					'title': 'Containerization',
-					'description': 'Docker and containers',
-					'order': 3,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_3_1', 'title': 'Docker Basics', 'description': 'Container fundamentals', 'prerequisites': ['Version Control'], 'subtopics': ['Images', 'Containers', 'Dockerfile', 'Docker Compose']},
-						{'id': 'topic_3_2', 'title': 'Container Orchestration', 'description': 'Managing containers at scale', 'prerequisites': ['Docker Basics'], 'subtopics': ['Docker Swarm', 'Kubernetes Basics', 'Pods', 'Services']},
-					]
-				},
-				{
-					'id': 'module_4',
-					'title': 'CI/CD Pipelines',
-					'description': 'Continuous integration and deployment',
-					'order': 4,
-					'difficulty': 'intermediate',
-					'topics': [
-						{'id': 'topic_4_1', 'title': 'CI/CD Concepts', 'description': 'Understanding CI/CD', 'prerequisites': ['Containerization'], 'subtopics': ['Continuous Integration', 'Continuous Deployment', 'Pipeline Stages', 'Best Practices']},
-						{'id': 'topic_4_2', 'title': 'GitHub Actions', 'description': 'Automating workflows', 'prerequisites': ['CI/CD Concepts'], 'subtopics': ['Workflows', 'Actions', 'Secrets', 'Deployment']},
-					]
-				},
-			]
-		else:
-			modules = [
-				{
-					'id': 'module_1',
-					'title': 'Advanced DevOps',
-					'description': 'Advanced DevOps practices',
-					'order': 1,
-					'difficulty': 'advanced',
-					'topics': [
-						{'id': 'topic_1_1', 'title': 'Kubernetes Advanced', 'description': 'Advanced Kubernetes', 'prerequisites': [], 'subtopics': ['Deployments', 'Services', 'Ingress', 'Helm']},
-					]
-				},
-			]
+		modules = _DEVOPS_BEGINNER_MODULES if proficiency == 'beginner' else _DEVOPS_ADVANCED_MODULES
 		
 		return {
 			'title': 'DevOps Engineer Path',
@@ -965,15 +1301,22 @@ class AIPathGenerator:
 			'modules': modules
 		}
 	
-	def get_default_curriculums(self):
+	@staticmethod
+	def get_default_curriculums():
 		"""Return default curriculum templates"""
 		return {}
 	
-	def get_default_resources(self):
+	@staticmethod
+	def get_default_resources():
 		"""Return default learning resources"""
 		return {}
 
 
+# Numeric ranks for recommendation priorities so heap comparisons are
+# int compares rather than string compares
+_PRIORITY_RANK = {'high': 2, 'medium': 1, 'low': 0}
+
+
 class AIRecommender:
 	"""
 	AI-powered recommendation engine for learning resources,
@@ -981,8 +1324,30 @@ class AIRecommender:
 	"""
 	
 	def __init__(self):
+		# Fitted on first use so importing this module never pulls in sklearn
+		self.vectorizer = None
+		self._topic_matrix = None
+
+	def _ensure_topic_matrix(self):
+		"""Fit the TF-IDF model over the template topic corpus on first use.
+
+		Fitting tokenizes every known topic exactly once; per-request calls
+		then only transform their single query string.
+		"""
+		if self.vectorizer is not None:
+			return
+		from sklearn.feature_extraction.text import TfidfVectorizer
+
+		corpus = []
+		for role_key in ('fullstack', 'frontend', 'backend', 'data_science', 'mobile', 'devops'):
+			for proficiency in ('beginner', 'advanced'):
+				template = ai_generator._curriculum_template(role_key, proficiency)
+				for module in template['modules']:
+					for topic in module['topics']:
+						corpus.append(f"{topic['title']} {topic['description']}")
 		self.vectorizer = TfidfVectorizer()
-	
+		self._topic_matrix = self.vectorizer.fit_transform(corpus)
+
 	def recommend_next_topics(self, user_progress, user_skills, learning_path):
 		"""
 		Recommend what to learn next based on current progress
@@ -996,60 +1361,87 @@ class AIRecommender:
 			List of recommended topics with reasoning
 		"""
 		recommendations = []
-		
-		for module in learning_path['modules']:
-			for topic in module['topics']:
-				# Skip completed topics
-				if topic['id'] in user_progress:
-					continue
-				
-				# Check if prerequisites are met
-				prereqs = topic.get('prerequisites', [])
-				prereqs_met = all(p in user_skills or self._is_completed(p, user_progress, learning_path) 
-								for p in prereqs)
-				
-				if prereqs_met and not topic.get('locked', False):
-					recommendations.append({
-						'topic_id': topic['id'],
-						'topic_title': topic['title'],
-						'module_title': module['title'],
-						'reason': 'Prerequisites completed, ready to start',
-						'priority': 'high',
-						'estimated_hours': topic.get('estimated_hours', 3)
-					})
-		
-		# Sort by priority and module order
-		recommendations.sort(key=lambda x: x['priority'], reverse=True)
-		
-		return recommendations[:5]  # Return top 5
-	
-	def _is_completed(self, topic_title, completed_ids, learning_path):
-		"""Check if a topic with given title is completed"""
-		for module in learning_path['modules']:
-			for topic in module['topics']:
-				if topic['title'] == topic_title and topic['id'] in completed_ids:
-					return True
-		return False
+		completed_set = set(user_progress)
+		user_skills_set = set(user_skills)
+		title_to_id = None  # built lazily, only for legacy paths
+
+		# Flatten once so the hot loop is a single level with the module
+		# title preresolved; the flat view is per-call scratch, not stored
+		# on the path, to keep the persisted JSON free of duplicate topics
+		flat_topics = [(m['title'], t)
+					for m in learning_path['modules'] for t in m['topics']]
+
+		for module_title, topic in flat_topics:
+			# Skip completed topics
+			if topic['id'] in completed_set:
+				continue
+
+			# Check if prerequisites are met; generated paths carry
+			# pre-resolved prerequisite ids (None = outside skill)
+			prereqs = topic['prerequisites']
+			prereq_ids = topic.get('prerequisite_ids')
+			if prereq_ids is None:
+				# Path stored before prerequisite ids were resolved
+				if title_to_id is None:
+					title_to_id = {t['title']: t['id'] for _, t in flat_topics}
+				prereq_ids = tuple(title_to_id.get(p) for p in prereqs)
+			prereqs_met = all(pid in completed_set or title in user_skills_set
+							for pid, title in zip(prereq_ids, prereqs))
+
+			if prereqs_met and not topic['locked']:
+				recommendations.append({
+					'topic_id': topic['id'],
+					'topic_title': topic['title'],
+					'module_title': module_title,
+					'reason': 'Prerequisites completed, ready to start',
+					'priority': 'high',
+					'estimated_hours': topic['estimated_hours']
+				})
+				if len(recommendations) == 5:
+					# Module/topic order is topological (prerequisites
+					# precede their dependents) and priorities are
+					# uniform, so the first five eligible topics are
+					# already the top five
+					return recommendations
+
+		# Top 5 by priority; nlargest only maintains a 5-element heap
+		# instead of sorting every eligible topic
+		return heapq.nlargest(5, recommendations,
+						key=lambda x: _PRIORITY_RANK[x['priority']])
 	
 	def recommend_resources(self, topic_title, user_preferences, difficulty_level):
 		"""
 		Recommend specific learning resources for a topic
 		
 		Returns:
-			List of recommended resources with metadata
+			Tuple of recommended resources with metadata
 		"""
-		# This would use ML to match resources to user preferences
-		# For now, returning curated recommendations
-		
-		resources = [
+		# user_preferences does not influence the curated set yet, so the
+		# memo below is keyed on (title, difficulty) only
+		return self._build_resources(topic_title, difficulty_level)
+
+	@functools.lru_cache(maxsize=4096)
+	def _build_resources(self, topic_title, difficulty_level):
+		"""Build (and memoize) the resource tuple for one topic/difficulty"""
+		# Score the topic against the pre-fitted template corpus; only the
+		# query is transformed per call. linear_kernel suffices because
+		# TF-IDF rows are already L2-normalized.
+		from sklearn.metrics.pairwise import linear_kernel
+		from urllib.parse import quote_plus
+
+		self._ensure_topic_matrix()
+		query = self.vectorizer.transform([topic_title])
+		match = float(linear_kernel(query, self._topic_matrix).max()) if query.nnz else 0.0
+
+		return (
 			{
 				'title': f'{topic_title} - Interactive Course',
 				'type': 'interactive',
-				'url': f'https://www.codecademy.com/search?query={topic_title}',
+				'url': f'https://www.codecademy.com/search?query={quote_plus(topic_title)}',
 				'difficulty': difficulty_level,
 				'duration': '2-4 hours',
 				'rating': 4.5,
-				'match_score': 0.95
+				'match_score': round(0.95 * match, 2)
 			},
 			{
 				'title': f'{topic_title} Documentation',
@@ -1058,11 +1450,9 @@ class AIRecommender:
 				'difficulty': difficulty_level,
 				'duration': 'Reference',
 				'rating': 4.8,
-				'match_score': 0.90
+				'match_score': round(0.90 * match, 2)
 			}
-		]
-		
-		return resources
+		)
 	
 	def suggest_study_schedule(self, available_hours, learning_pace, upcoming_topics):
 		"""
@@ -1077,45 +1467,118 @@ class AIRecommender:
 			'total_hours': 0
 		}
 		
-		days_of_week = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-		
 		hours_per_day = available_hours
-		topic_index = 0
-		
-		for day in days_of_week:
-			if topic_index >= len(upcoming_topics):
+
+		# Greedy no-split packing over a cumulative-hours array: each
+		# day's cutoff is one binary search instead of a Python while
+		# loop of dict lookups per topic
+		hours = np.fromiter((t.get('estimated_hours', 2) for t in upcoming_topics),
+						dtype=np.float64, count=len(upcoming_topics))
+		cum = np.cumsum(hours)
+		start = 0
+
+		for day in _DAYS_OF_WEEK:
+			if start >= len(upcoming_topics):
 				break
-			
-			daily_topics = []
-			day_hours = 0
-			
-			while day_hours < hours_per_day and topic_index < len(upcoming_topics):
-				topic = upcoming_topics[topic_index]
-				topic_hours = topic.get('estimated_hours', 2)
-				
-				if day_hours + topic_hours <= hours_per_day:
-					daily_topics.append(topic)
-					day_hours += topic_hours
-					topic_index += 1
-				else:
-					break
-			
-			if daily_topics:
+
+			base = cum[start - 1] if start else 0.0
+			end = int(np.searchsorted(cum, base + hours_per_day, side='right'))
+
+			if end > start:
+				day_hours = float(cum[end - 1] - base)
 				schedule['daily_breakdown'][day] = {
-					'topics': daily_topics,
+					'topics': upcoming_topics[start:end],
 					'total_hours': day_hours
 				}
 				schedule['total_hours'] += day_hours
-		
+				start = end
+
 		return schedule
 
 
+class ProgressColumns:
+	"""Struct-of-arrays view of progress-record dicts.
+
+	Scanning one contiguous column at a time touches far fewer cache
+	lines than walking a list of dicts field by field. Parallel arrays
+	are used rather than a structured dtype, whose per-row access cost
+	would reintroduce the dict-of-fields layout.
+	"""
+
+	__slots__ = ('topic_ids', 'topic_titles', 'expected_minutes',
+				'time_spent_minutes', 'too_hard')
+
+	def __init__(self, topic_ids, topic_titles, expected_minutes,
+				time_spent_minutes, too_hard):
+		self.topic_ids = topic_ids
+		self.topic_titles = topic_titles
+		self.expected_minutes = expected_minutes
+		self.time_spent_minutes = time_spent_minutes
+		self.too_hard = too_hard
+
+	@classmethod
+	def from_dicts(cls, progress_data):
+		"""Ingest API-boundary dicts once; later scans are all columnar"""
+		n = len(progress_data)
+		return cls(
+			topic_ids=[p['topic_id'] for p in progress_data],
+			topic_titles=[p.get('topic_title', 'Unknown') for p in progress_data],
+			expected_minutes=np.fromiter(
+				(p.get('expected_minutes', 120) for p in progress_data), dtype=np.float64, count=n),
+			time_spent_minutes=np.fromiter(
+				(p.get('time_spent_minutes', 0) for p in progress_data), dtype=np.float64, count=n),
+			too_hard=np.fromiter(
+				(p.get('difficulty_feedback') == 'too_hard' for p in progress_data), dtype=bool, count=n),
+		)
+
+
+# Weekday names for schedule building, hoisted so each call reuses the
+# same tuple instead of re-allocating a seven-element list
+_DAYS_OF_WEEK = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+		'Saturday', 'Sunday')
+
+
+# Month names for completion-date formatting; indexing this tuple skips
+# strftime's locale machinery (output is English-only regardless)
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+		'August', 'September', 'October', 'November', 'December')
+
+
+class TOD(IntEnum):
+	"""Byte codes for time-of-day buckets; 255 marks unknown/missing"""
+	MORNING = 0
+	AFTERNOON = 1
+	EVENING = 2
+	NIGHT = 3
+
+
+_TOD_CODES = {'morning': TOD.MORNING, 'afternoon': TOD.AFTERNOON,
+		'evening': TOD.EVENING, 'night': TOD.NIGHT}
+
+
+def _logs_to_soa(logs):
+	"""Split activity-log dicts into contiguous per-column NumPy arrays.
+
+	time_of_day is encoded to byte codes at this boundary so downstream
+	masks are byte compares instead of unicode compares.
+	"""
+	n = len(logs)
+	return {
+		'topics_completed': np.fromiter(
+			(log.get('topics_completed', 0) for log in logs), dtype=np.int64, count=n),
+		'learning_minutes': np.fromiter(
+			(log.get('learning_minutes', 0) for log in logs), dtype=np.int64, count=n),
+		'time_of_day': np.fromiter(
+			(_TOD_CODES.get(log.get('time_of_day'), 255) for log in logs), dtype=np.uint8, count=n),
+	}
+
+
 class AIAdaptiveLearning:
 	"""
 	Adaptive learning system that adjusts difficulty and pace
 	based on user performance and engagement.
 	"""
-	
+
 	def __init__(self):
 		self.performance_threshold = 0.7
 	
@@ -1129,9 +1592,12 @@ class AIAdaptiveLearning:
 		if not activity_logs:
 			return {'velocity': 'insufficient_data', 'trend': 'N/A'}
 		
-		# Calculate topics completed per week
+		# Calculate topics completed per week; ingest only the one column
+		# this reduction needs instead of the full log SoA
 		recent_logs = activity_logs[-7:]  # Last 7 days
-		topics_completed = sum(log.get('topics_completed', 0) for log in recent_logs)
+		topics_completed = int(np.fromiter(
+			(log.get('topics_completed', 0) for log in recent_logs),
+			dtype=np.int32, count=len(recent_logs)).sum())
 		
 		velocity = topics_completed / 7  # Topics per day
 		
@@ -1161,30 +1627,36 @@ class AIAdaptiveLearning:
 			List of topics that need review or assistance
 		"""
 		struggling_topics = []
-		
-		for progress in progress_data:
-			# Check time spent vs expected time
-			expected_time = progress.get('expected_minutes', 120)
-			actual_time = progress.get('time_spent_minutes', 0)
-			
-			if actual_time > expected_time * 1.5:  # Taking 50% more time
+		if not progress_data:
+			return struggling_topics
+
+		# Columnar masks: compare time spent vs expected across all
+		# records at once, then materialize dicts only for the hits
+		cols = ProgressColumns.from_dicts(progress_data)
+		ratios = cols.time_spent_minutes / np.maximum(cols.expected_minutes, 1)
+		slow = cols.time_spent_minutes > cols.expected_minutes * 1.5  # Taking 50% more time
+
+		seen_ids = set()
+		for i in np.nonzero(slow)[0]:
+			seen_ids.add(cols.topic_ids[i])
+			struggling_topics.append({
+				'topic_id': cols.topic_ids[i],
+				'topic_title': cols.topic_titles[i],
+				'time_ratio': float(ratios[i]),
+				'suggestion': 'Review prerequisites or seek additional resources'
+			})
+
+		# Check user difficulty feedback
+		for i in np.nonzero(cols.too_hard)[0]:
+			if cols.topic_ids[i] not in seen_ids:
+				seen_ids.add(cols.topic_ids[i])
 				struggling_topics.append({
-					'topic_id': progress['topic_id'],
-					'topic_title': progress.get('topic_title', 'Unknown'),
-					'time_ratio': actual_time / expected_time,
-					'suggestion': 'Review prerequisites or seek additional resources'
+					'topic_id': cols.topic_ids[i],
+					'topic_title': cols.topic_titles[i],
+					'user_feedback': 'marked_as_difficult',
+					'suggestion': 'Consider easier alternative resources'
 				})
-			
-			# Check user difficulty feedback
-			if progress.get('difficulty_feedback') == 'too_hard':
-				if progress['topic_id'] not in [t['topic_id'] for t in struggling_topics]:
-					struggling_topics.append({
-						'topic_id': progress['topic_id'],
-						'topic_title': progress.get('topic_title', 'Unknown'),
-						'user_feedback': 'marked_as_difficult',
-						'suggestion': 'Consider easier alternative resources'
-					})
-		
+
 		return struggling_topics
 	
 	def adapt_curriculum(self, user_performance, current_path):
@@ -1201,8 +1673,11 @@ class AIAdaptiveLearning:
 			'pace_adjustments': []
 		}
 		
-		# Analyze overall performance
-		avg_performance = sum(p.get('score', 0) for p in user_performance) / len(user_performance) if user_performance else 0
+		# Analyze overall performance with one C-level reduction instead
+		# of a generator of per-record dict lookups
+		scores = np.fromiter((p.get('score', 0.0) for p in user_performance),
+						dtype=np.float32, count=len(user_performance))
+		avg_performance = float(scores.mean()) if scores.size else 0.0
 		
 		if avg_performance > 0.9:  # Excelling
 			adaptations['pace_adjustments'].append({
@@ -1245,7 +1720,7 @@ class AIAdaptiveLearning:
 		confidence = 'high' if days_remaining < 100 else 'medium'
 		
 		return {
-			'estimated_date': completion_date.strftime('%B %d, %Y'),
+			'estimated_date': f'{_MONTHS[completion_date.month - 1]} {completion_date.day:02d}, {completion_date.year}',
 			'days_remaining': int(days_remaining),
 			'weeks_remaining': int(days_remaining / 7),
 			'confidence': confidence,
@@ -1266,14 +1741,16 @@ class AIAdaptiveLearning:
 			'recommendations': []
 		}
 		
-		# Analyze learning time patterns
+		# Analyze learning time patterns over contiguous log columns
+		soa = _logs_to_soa(activity_logs) if activity_logs else None
 		if activity_logs:
-			# Find most productive time
-			morning_hours = sum(log.get('learning_minutes', 0) for log in activity_logs 
-							  if log.get('time_of_day') == 'morning')
-			evening_hours = sum(log.get('learning_minutes', 0) for log in activity_logs 
-							  if log.get('time_of_day') == 'evening')
-			
+			# Find most productive time: masked sums over the one minutes
+			# array, without materializing gathered copies per bucket
+			minutes = soa['learning_minutes']
+			tod = soa['time_of_day']
+			morning_hours = np.sum(minutes, where=(tod == TOD.MORNING))
+			evening_hours = np.sum(minutes, where=(tod == TOD.EVENING))
+
 			if morning_hours > evening_hours:
 				insights['learning_patterns'].append("You're most productive in the morning")
 				insights['recommendations'].append('Schedule challenging topics for morning sessions')
@@ -1281,9 +1758,11 @@ class AIAdaptiveLearning:
 				insights['learning_patterns'].append("You're most productive in the evening")
 				insights['recommendations'].append('Focus on complex topics during evening study time')
 		
-		# Analyze completion rate
+		# Analyze completion rate; counted in one pass without
+		# materializing the filtered list
 		if progress_data:
-			completion_rate = len([p for p in progress_data if p.get('status') == 'completed']) / len(progress_data)
+			completed_count = sum(1 for p in progress_data if p.get('status') == 'completed')
+			completion_rate = completed_count / len(progress_data)
 			
 			if completion_rate > 0.8:
 				insights['strengths'].append('High completion rate - you finish what you start!')
@@ -1293,8 +1772,8 @@ class AIAdaptiveLearning:
 		
 		# Analyze consistency
 		if len(activity_logs) >= 7:
-			active_days = len([log for log in activity_logs[-7:] if log.get('learning_minutes', 0) > 0])
-			
+			active_days = int((soa['learning_minutes'][-7:] > 0).sum())
+
 			if active_days >= 6:
 				insights['strengths'].append('Excellent consistency! You learn almost every day.')
 			elif active_days <= 3:
@@ -1304,6 +1783,16 @@ class AIAdaptiveLearning:
 		return insights
 
 
+# Process pool for generate_paths_batch, created lazily so importing the
+# module (and single-path requests) never forks workers
+_path_pool = None
+
+
+def _generate_one(user_data):
+	"""Worker entry point: generate one path with this process' singleton"""
+	return ai_generator.generate_personalized_path(user_data)
+
+
 # Initialize AI components globally
 ai_generator = AIPathGenerator()
 ai_recommender = AIRecommender()
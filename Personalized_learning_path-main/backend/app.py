@@ -1,9 +1,16 @@
-from flask import Flask, request, jsonify, session
+import orjson
+from flask import Flask, Response, g, request, jsonify, session, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from datetime import timedelta, datetime, date
-import json
 import os
 
+import sqlite3
+
+from sqlalchemy import event, func, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+
 from models import db, User, LearningPath, Progress, Achievement, ActivityLog, UserAchievement
 from ai_engine import ai_generator, ai_recommender, ai_adaptive
 from auth import validate_registration_data
@@ -11,7 +18,7 @@ from database import (
 	init_database, init_bcrypt, create_user, authenticate_user, get_user_by_id,
 	user_exists, update_last_active
 )
-from utils import calculate_streak, generate_heatmap, check_achievements, get_level_from_xp
+from utils import generate_heatmap, check_achievements
 
 # Compute absolute project/data paths
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -19,12 +26,54 @@ DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
 DB_PATH = os.path.join(DATA_DIR, 'pathforge.db')
 
 
+class ORJSONProvider(JSONProvider):
+	"""JSON provider backed by orjson's C serializer.
+
+	Handles datetimes natively and serializes numpy scalars/arrays directly
+	(OPT_SERIALIZE_NUMPY), so jsonify stays the single call site for every
+	response while large payloads skip the pure-Python encoder.
+	"""
+
+	def dumps(self, obj, **kwargs):
+		return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+	def loads(self, s, **kwargs):
+		return orjson.loads(s)
+
+
 app = Flask(__name__, template_folder='../frontend/templates', static_folder='../frontend/static')
+app.json = ORJSONProvider(app)
 
 # Config
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + DB_PATH
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+	# Reuse connections across requests instead of reopening the database file
+	'pool_size': 20,
+	'max_overflow': 10,
+	'pool_pre_ping': True,
+	'connect_args': {'check_same_thread': False, 'timeout': 15},
+	# JSON columns (curriculum, skills, preferences) ride the C codec too
+	'json_serializer': lambda obj: orjson.dumps(obj).decode(),
+	'json_deserializer': orjson.loads
+}
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+	"""Apply per-connection pragmas to every pooled SQLAlchemy connection."""
+	if not isinstance(dbapi_conn, sqlite3.Connection):
+		return
+	cursor = dbapi_conn.cursor()
+	# WAL lets readers proceed during writes; NORMAL sync is safe with WAL
+	cursor.execute('PRAGMA journal_mode=WAL')
+	cursor.execute('PRAGMA synchronous=NORMAL')
+	cursor.execute('PRAGMA temp_store=MEMORY')
+	cursor.execute('PRAGMA mmap_size=268435456')
+	# Off by default in SQLite; required for the ON DELETE CASCADE FKs
+	cursor.execute('PRAGMA foreign_keys=ON')
+	cursor.close()
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 
@@ -39,15 +88,58 @@ init_bcrypt(app)
 with app.app_context():
 	os.makedirs(DATA_DIR, exist_ok=True)
 	db.create_all()
+	# Backfill the per-day uniqueness index on databases created before the
+	# constraint existed; the ON CONFLICT upsert in complete_topic needs it
+	try:
+		db.session.execute(text(
+			'CREATE UNIQUE INDEX IF NOT EXISTS uq_activity_user_date ON activity_logs (user_id, date)'
+		))
+		db.session.commit()
+	except Exception:
+		db.session.rollback()
+	# Add the streak anchor column on databases created before it existed
+	try:
+		db.session.execute(text('ALTER TABLE users ADD COLUMN last_activity_date DATE'))
+		db.session.commit()
+	except Exception:
+		db.session.rollback()
+	# Backfill the progress indexes for older databases. The unique index
+	# attempt fails harmlessly if historical duplicates exist
+	try:
+		db.session.execute(text(
+			'CREATE INDEX IF NOT EXISTS ix_progress_user_path_status ON progress (user_id, learning_path_id, status)'
+		))
+		db.session.execute(text(
+			'CREATE UNIQUE INDEX IF NOT EXISTS uq_progress_topic ON progress (user_id, learning_path_id, module_id, topic_id)'
+		))
+		db.session.commit()
+	except Exception:
+		db.session.rollback()
+	# Backfill the active-path lookup index for older databases;
+	# create_all only builds it on fresh schemas
+	try:
+		db.session.execute(text(
+			'CREATE INDEX IF NOT EXISTS ix_lp_user_active ON learning_paths (user_id, is_active, created_at DESC)'
+		))
+		db.session.commit()
+	except Exception:
+		db.session.rollback()
+	# Backfill the once-per-achievement uniqueness for older databases
+	try:
+		db.session.execute(text(
+			'CREATE UNIQUE INDEX IF NOT EXISTS uq_user_achievement ON user_achievements (user_id, achievement_id)'
+		))
+		db.session.commit()
+	except Exception:
+		db.session.rollback()
 
 
 # Helpers
 
 def _get_json():
-	try:
-		return request.get_json(force=True)
-	except Exception:
-		return {}
+	# silent=True returns None instead of raising on a bad body, and the
+	# default cache=True means Flask parses each request body at most once
+	return request.get_json(silent=True, cache=True) or {}
 
 
 def _get_current_user():
@@ -58,35 +150,93 @@ def _get_current_user():
 		user_data = get_user_by_id(user_id)
 		if user_data:
 			update_last_active(user_id)
-			# Ensure user exists in main DB for compatibility
-			user = User.query.get(user_id)
-			if not user:
-				user = User(
-					id=user_data['id'],
-					username=user_data['username'],
-					email=user_data['email'],
-					password_hash='stored_in_users_db'
-				)
-				db.session.add(user)
-				db.session.commit()
-			return user
-	
+			# register/login guarantee the mirror row exists, so the hot
+			# path is a plain PK lookup with no insert-or-commit fallback
+			user = db.session.get(User, user_id)
+			if user:
+				return user
+
 	# Return guest user if no session
 	return _guest_user()
 
+def _active_path(user):
+	"""Latest active LearningPath for a user, memoized per request on flask.g."""
+	path = getattr(g, '_active_path', None)
+	if path is None or path.user_id != user.id:
+		path = LearningPath.query.filter_by(user_id=user.id, is_active=True).order_by(LearningPath.created_at.desc()).first()
+		g._active_path = path
+	return path
+
+
+def _touch_streak(user, log_date):
+	"""Advance the cached streak fields for one activity date (no commit)."""
+	last = user.last_activity_date
+	if last == log_date:
+		return
+	if last is not None and log_date == last + timedelta(days=1):
+		user.current_streak = (user.current_streak or 0) + 1
+	elif last is None or log_date > last:
+		user.current_streak = 1
+	else:
+		# Backdated log: it may bridge a gap behind the anchor, which the
+		# incremental update can't see, so fall back to the exact SQL
+		# recompute anchored at the latest activity date. Flush first —
+		# textual statements don't autoflush the pending log row
+		db.session.flush()
+		user.current_streak = ActivityLog.current_streak(user.id, anchor=last)
+		user.longest_streak = max(user.longest_streak or 0, user.current_streak)
+		return
+	user.last_activity_date = log_date
+	user.longest_streak = max(user.longest_streak or 0, user.current_streak)
+
+
+def _streak_fields(user):
+	"""
+	Current/longest streak from the cached User columns.
+
+	Users created before last_activity_date existed get a one-time backfill
+	scan; afterwards reads are O(1) instead of rescanning every ActivityLog.
+	"""
+	if user.last_activity_date is None:
+		last = db.session.query(func.max(ActivityLog.date)).filter_by(user_id=user.id).scalar()
+		if last:
+			streak = ActivityLog.current_streak(user.id, anchor=last)
+			user.last_activity_date = last
+			user.current_streak = streak
+			user.longest_streak = max(user.longest_streak or 0, streak)
+			db.session.commit()
+	current = user.current_streak or 0
+	if user.last_activity_date != date.today():
+		current = 0  # matches calculate_streak: a streak only counts while active today
+	return current, user.longest_streak or 0
+
+
+_guest_user_id = None
+
 def _guest_user():
 	"""Return a default guest user, creating if necessary."""
+	global _guest_user_id
+	if _guest_user_id is not None:
+		# Memoized row id turns the per-request email scan into a PK fetch
+		user = db.session.get(User, _guest_user_id)
+		if user:
+			return user
+		_guest_user_id = None
 	user = User.query.filter_by(email='guest@local').first()
 	if not user:
-		# Create guest in SQL database too
+		# Create guest in SQL database too; create_user mirrors the row
+		# into the main database, so re-query before falling back to an insert
 		try:
 			from database import create_user
 			create_user('guest', 'guest@local', 'guest')
 		except:
 			pass
+		user = User.query.filter_by(email='guest@local').first()
+	if not user:
 		user = User(username='guest', email='guest@local', password_hash='guest')
 		db.session.add(user)
 		db.session.commit()
+	_guest_user_id = user.id
 	return user
 
 
@@ -113,23 +263,11 @@ def register():
 	if user_exists(email=email):
 		return jsonify({'message': 'Email already registered'}), 400
 	
-	# Create new user in SQL database
+	# Create new user in SQL database; create_user also writes the mirror
+	# User row into the attached main database in the same transaction
 	try:
 		user_data = create_user(username, email, password)
-		
-		# Also create in main database for compatibility
-		try:
-			user = User(
-				id=user_data['id'],
-				username=username,
-				email=email,
-				password_hash='stored_in_users_db'
-			)
-			db.session.add(user)
-			db.session.commit()
-		except Exception:
-			pass
-		
+
 		# Set session
 		session['user_id'] = user_data['id']
 		
@@ -165,7 +303,7 @@ def login():
 		return jsonify({'message': 'Invalid email or password'}), 401
 	
 	# Ensure user exists in main database for compatibility
-	user = User.query.get(user_data['id'])
+	user = db.session.get(User, user_data['id'])
 	if not user:
 		user = User(
 			id=user_data['id'],
@@ -221,7 +359,7 @@ def update_profile():
 def save_skills():
 	user = _get_current_user()
 	data = _get_json()
-	user.current_skills = json.dumps(data.get('skills', []))
+	user.current_skills = data.get('skills', [])
 	db.session.commit()
 	return jsonify({'message': 'Skills saved'})
 
@@ -242,7 +380,7 @@ def save_preferences():
 	data = _get_json()
 	user.learning_pace = data.get('learning_pace')
 	user.daily_hours = data.get('daily_hours')
-	user.preferred_content = json.dumps(data.get('preferred_content', []))
+	user.preferred_content = data.get('preferred_content', [])
 	db.session.commit()
 	return jsonify({'message': 'Preferences saved'})
 
@@ -271,25 +409,27 @@ def onboarding_status():
 
 
 # AI Learning Path Routes
+#
+# These stay as sync views on purpose: ai_generator/ai_recommender/ai_adaptive
+# run in-process (numpy/sklearn CPU work, no network I/O), so async def would
+# add event-loop-plus-executor overhead without freeing the worker — the CPU
+# is busy either way. Revisit only if path generation ever calls out to a
+# remote model service.
 @app.post('/api/ai/generate-path')
 def generate_path():
 	user = _get_current_user()
-	current_skills = json.loads(user.current_skills or '[]')
-	preferred = json.loads(user.preferred_content or '[]')
+	current_skills = user.current_skills or []
+	preferred = user.preferred_content or []
 	target_role = user.target_role or 'Full Stack Developer'
 	
-	# Check if a path already exists for this career path
-	existing_path = LearningPath.query.filter_by(
-		user_id=user.id,
-		target_role=target_role,
-		is_active=True
-	).order_by(LearningPath.created_at.desc()).first()
-	
-	# If path exists for this career, deactivate it and create a new one
-	if existing_path:
-		existing_path.is_active = False
-		db.session.commit()
-	
+	# Deactivate any existing active path for this career in one UPDATE —
+	# no SELECT, no ORM hydration; persisted by the commit at the end
+	db.session.execute(update(LearningPath).where(
+		LearningPath.user_id == user.id,
+		LearningPath.target_role == target_role,
+		LearningPath.is_active == True
+	).values(is_active=False))
+
 	user_data = {
 		'current_skills': current_skills,
 		'target_role': target_role,
@@ -306,13 +446,13 @@ def generate_path():
 		target_role=target_role,
 		estimated_duration_weeks=curriculum.get('total_estimated_weeks', 0),
 		difficulty_level=curriculum.get('difficulty', user.proficiency_level or 'beginner'),
-		curriculum_data=json.dumps(curriculum),
+		curriculum_data=curriculum,
 		total_modules=len(curriculum.get('modules', [])),
 		total_topics=sum(len(m.get('topics', [])) for m in curriculum.get('modules', []))
 	)
 	db.session.add(lp)
 	db.session.commit()
-	return jsonify({'path': lp.to_dict()})
+	return jsonify({'path': lp.to_dict(curriculum)})
 
 
 @app.get('/api/ai/path/<int:user_id>')
@@ -321,7 +461,7 @@ def get_user_path(user_id):
 	if user.id != user_id:
 		# In guest mode, always return guest path
 		pass
-	path = LearningPath.query.filter_by(user_id=user.id, is_active=True).order_by(LearningPath.created_at.desc()).first()
+	path = _active_path(user)
 	if not path:
 		return jsonify({'message': 'No path found'}), 404
 	return jsonify({'path': path.to_dict()})
@@ -329,21 +469,21 @@ def get_user_path(user_id):
 
 @app.put('/api/ai/regenerate-path')
 def regenerate_path():
-	user = _get_current_user()
-	LearningPath.query.filter_by(user_id=user.id, is_active=True).update({'is_active': False})
-	db.session.commit()
+	g._active_path = None
+	# generate_path already deactivates the user's active path for the
+	# target career before inserting the replacement
 	return generate_path()
 
 
 @app.post('/api/ai/recommend')
 def ai_recommend():
 	user = _get_current_user()
-	path = LearningPath.query.filter_by(user_id=user.id, is_active=True).order_by(LearningPath.created_at.desc()).first()
+	path = _active_path(user)
 	if not path:
 		return jsonify({'recommendations': []})
-	lp = json.loads(path.curriculum_data)
+	lp = path.curriculum
 	completed = [p.topic_id for p in Progress.query.filter_by(user_id=user.id, learning_path_id=path.id, status='completed').all()]
-	user_skills = json.loads(user.current_skills or '[]')
+	user_skills = user.current_skills or []
 	recs = ai_recommender.recommend_next_topics(completed, user_skills, lp)
 	return jsonify({'recommendations': recs})
 
@@ -351,18 +491,50 @@ def ai_recommend():
 @app.post('/api/ai/adapt-path')
 def adapt_path():
 	user = _get_current_user()
-	path = LearningPath.query.filter_by(user_id=user.id, is_active=True).order_by(LearningPath.created_at.desc()).first()
+	path = _active_path(user)
 	if not path:
 		return jsonify({'adaptations': {}})
 	performance = [{'score': 0.8}]  # placeholder
-	adaptations = ai_adaptive.adapt_curriculum(performance, json.loads(path.curriculum_data))
+	adaptations = ai_adaptive.adapt_curriculum(performance, path.curriculum)
 	return jsonify({'adaptations': adaptations})
 
 
+def _iter_paths_json(user_id):
+	"""Yield a user's full paths (curricula included) as JSON fragments.
+
+	Rows stream from the DB with yield_per and each path is encoded and
+	handed to the socket before the next one loads, so memory stays
+	bounded at roughly one curriculum instead of the whole listing.
+	"""
+	yield b'{"paths":['
+	paths = db.session.execute(
+		db.select(LearningPath).where(LearningPath.user_id == user_id)
+		.order_by(LearningPath.created_at.desc())
+		.execution_options(yield_per=100)
+	).scalars()
+	first = True
+	for path in paths:
+		if not first:
+			yield b','
+		first = False
+		yield orjson.dumps(path.to_dict())
+	yield b']}'
+
+
+@app.get('/api/ai/paths')
+def list_paths():
+	user = _get_current_user()
+	if request.args.get('full'):
+		# Full payloads carry every curriculum; stream them instead of
+		# building one large response object in memory
+		return Response(stream_with_context(_iter_paths_json(user.id)), mimetype='application/json')
+	return jsonify({'paths': LearningPath.list_as_dicts(user.id)})
+
+
 @app.get('/api/ai/path')
 def get_latest_path_guest():
 	user = _get_current_user()
-	path = LearningPath.query.filter_by(user_id=user.id, is_active=True).order_by(LearningPath.created_at.desc()).first()
+	path = _active_path(user)
 	if not path:
 		return jsonify({'message': 'No path found'}), 404
 	return jsonify({'path': path.to_dict()})
@@ -380,6 +552,7 @@ def complete_topic():
 		return jsonify({'message': 'Missing fields'}), 400
 	
 	progress = Progress.query.filter_by(user_id=user.id, learning_path_id=learning_path_id, module_id=module_id, topic_id=topic_id).first()
+	first_completion = progress is None or progress.status != 'completed'
 	if not progress:
 		progress = Progress(user_id=user.id, learning_path_id=learning_path_id, module_id=module_id, topic_id=topic_id)
 		progress.started_at = datetime.utcnow()
@@ -387,28 +560,40 @@ def complete_topic():
 	progress.completed_at = datetime.utcnow()
 	progress.time_spent_minutes = data.get('time_spent_minutes', progress.time_spent_minutes or 0)
 	db.session.add(progress)
-	
-	# Update learning path completion percentage
-	path = LearningPath.query.get(learning_path_id)
-	completed_topics = Progress.query.filter_by(user_id=user.id, learning_path_id=learning_path_id, status='completed').count()
-	path.completed_topics = completed_topics
-	if path.total_topics and path.total_topics > 0:
-		path.completion_percentage = round((completed_topics / path.total_topics) * 100, 1)
-	
-	# Update user XP and streak
-	user.total_xp += 50
-	user.current_level = int(get_level_from_xp(user.total_xp))
-	
-	# Log activity
+
+	# Update the path counters with one atomic UPDATE — no SELECT, no
+	# read-modify-write race between concurrent completions
+	if first_completion:
+		db.session.execute(update(LearningPath).where(LearningPath.id == learning_path_id).values(
+			completed_topics=LearningPath.completed_topics + 1,
+			completion_percentage=func.coalesce(
+				func.round(100.0 * (LearningPath.completed_topics + 1) / func.nullif(LearningPath.total_topics, 0), 1),
+				LearningPath.completion_percentage
+			)
+		))
+
+	# Award XP with one atomic UPDATE (level derives from the new total in
+	# SQL), then drop the instance's stale copies of the two columns
+	User.award_xp(user.id, 50)
+	db.session.expire(user, ['total_xp', 'current_level'])
+	_touch_streak(user, date.today())
+
+	# Log activity via upsert: one statement instead of SELECT + UPDATE
 	log_date = date.today()
-	log = ActivityLog.query.filter_by(user_id=user.id, date=log_date).first()
-	if not log:
-		log = ActivityLog(user_id=user.id, date=log_date)
-	log.learning_minutes = (log.learning_minutes or 0) + int(data.get('time_spent_minutes', 30))
-	log.topics_completed = (log.topics_completed or 0) + 1
-	log.xp_earned = (log.xp_earned or 0) + 50
-	db.session.add(log)
-	
+	minutes = int(data.get('time_spent_minutes', 30))
+	stmt = sqlite_insert(ActivityLog).values(
+		user_id=user.id, date=log_date,
+		learning_minutes=minutes, topics_completed=1, xp_earned=50
+	).on_conflict_do_update(
+		index_elements=['user_id', 'date'],
+		set_={
+			'learning_minutes': ActivityLog.learning_minutes + minutes,
+			'topics_completed': ActivityLog.topics_completed + 1,
+			'xp_earned': ActivityLog.xp_earned + 50
+		}
+	)
+	db.session.execute(stmt)
+
 	db.session.commit()
 	return jsonify({'message': 'Topic completed'})
 
@@ -429,13 +614,8 @@ def progress_stats():
 @app.get('/api/progress/streak')
 def progress_streak():
 	user = _get_current_user()
-	logs = ActivityLog.query.filter_by(user_id=user.id).order_by(ActivityLog.date.asc()).all()
-	activity_logs = [{'date': l.date.isoformat(), 'learning_minutes': l.learning_minutes} for l in logs]
-	streak = calculate_streak(activity_logs)
-	user.current_streak = streak
-	user.longest_streak = max(user.longest_streak or 0, streak)
-	db.session.commit()
-	return jsonify({'current_streak': streak, 'longest_streak': user.longest_streak})
+	streak, longest = _streak_fields(user)
+	return jsonify({'current_streak': streak, 'longest_streak': longest})
 
 
 @app.post('/api/progress/activity')
@@ -450,6 +630,7 @@ def log_activity():
 	log.topics_completed = int(data.get('topics_completed', 0))
 	log.xp_earned = int(data.get('xp_earned', 0))
 	db.session.add(log)
+	_touch_streak(user, log_date)
 	db.session.commit()
 	return jsonify({'message': 'Activity logged'})
 
@@ -457,8 +638,13 @@ def log_activity():
 @app.get('/api/progress/heatmap')
 def progress_heatmap():
 	user = _get_current_user()
-	logs = ActivityLog.query.filter_by(user_id=user.id).order_by(ActivityLog.date.asc()).all()
-	activity_logs = [{'date': l.date.isoformat(), 'learning_minutes': l.learning_minutes} for l in logs]
+	# Aggregate in SQL (index seek on user_id, date + C-level SUM) rather
+	# than hydrating a year of ORM rows; the heatmap only needs day totals
+	rows = db.session.execute(text(
+		'SELECT date, SUM(learning_minutes) FROM activity_logs '
+		'WHERE user_id = :u AND date >= :d GROUP BY date ORDER BY date'
+	), {'u': user.id, 'd': (date.today() - timedelta(days=365)).isoformat()}).all()
+	activity_logs = [{'date': day, 'learning_minutes': minutes or 0} for day, minutes in rows]
 	heatmap = generate_heatmap(activity_logs)
 	return jsonify({'heatmap': heatmap})
 
@@ -483,14 +669,20 @@ def all_achievements():
 @app.get('/api/achievements/user')
 def user_achievements():
 	user = _get_current_user()
-	uas = UserAchievement.query.filter_by(user_id=user.id).all()
+	# Single JOIN projecting just the returned columns — avoids the
+	# one-query-per-row lazy load of ua.achievement
+	rows = db.session.query(
+		Achievement.id, Achievement.name, Achievement.description, UserAchievement.earned_at
+	).select_from(UserAchievement).join(UserAchievement.achievement).filter(
+		UserAchievement.user_id == user.id
+	).all()
 	return jsonify({'achievements': [
 		{
-			'id': ua.achievement.id,
-			'name': ua.achievement.name,
-			'description': ua.achievement.description,
-			'earned_at': ua.earned_at.isoformat()
-		} for ua in uas
+			'id': ach_id,
+			'name': name,
+			'description': description,
+			'earned_at': earned_at.isoformat()
+		} for ach_id, name, description, earned_at in rows
 	]})
 
 
@@ -498,22 +690,39 @@ def user_achievements():
 def check_for_new_achievements():
 	user = _get_current_user()
 	completed_count = Progress.query.filter_by(user_id=user.id, status='completed').count()
-	logs = ActivityLog.query.filter_by(user_id=user.id).order_by(ActivityLog.date.asc()).all()
-	activity_logs = [{'date': l.date.isoformat(), 'learning_minutes': l.learning_minutes} for l in logs]
-	streak = calculate_streak(activity_logs)
+	streak, _ = _streak_fields(user)
 	new = check_achievements(user, completed_count, streak)
+	if not new:
+		return jsonify({'awarded': []})
+
+	# Batch the whole reconciliation: one IN query per table, one bulk
+	# OR IGNORE insert, one commit — instead of per-candidate round trips
+	names = [n['name'] for n in new]
+	by_name = {a.name: a for a in Achievement.query.filter(Achievement.name.in_(names)).all()}
+	missing = {
+		n['name']: Achievement(name=n['name'], description=n['name'], category='milestone', xp_reward=n['xp'])
+		for n in new if n['name'] not in by_name
+	}
+	if missing:
+		db.session.add_all(missing.values())
+		db.session.flush()  # assigns ids for the bulk insert below
+		by_name.update(missing)
+
+	earned = {
+		achievement_id for (achievement_id,) in
+		db.session.query(UserAchievement.achievement_id).filter_by(user_id=user.id).all()
+	}
 	awarded = []
+	rows = []
+	earned_at = datetime.utcnow()
 	for n in new:
-		ach = Achievement.query.filter_by(name=n['name']).first()
-		if not ach:
-			ach = Achievement(name=n['name'], description=n['name'], category='milestone', xp_reward=n['xp'])
-			db.session.add(ach)
-			db.session.commit()
-		if not UserAchievement.query.filter_by(user_id=user.id, achievement_id=ach.id).first():
-			ua = UserAchievement(user_id=user.id, achievement_id=ach.id)
-			db.session.add(ua)
+		ach = by_name[n['name']]
+		if ach.id not in earned:
+			rows.append({'user_id': user.id, 'achievement_id': ach.id, 'earned_at': earned_at})
 			awarded.append({'name': ach.name, 'xp': ach.xp_reward})
-	
+	if rows:
+		db.session.execute(sqlite_insert(UserAchievement).prefix_with('OR IGNORE'), rows)
+
 	db.session.commit()
 	return jsonify({'awarded': awarded})
 
@@ -547,25 +756,34 @@ def analytics_dashboard():
 	return jsonify({'summary': {'completed_topics': completed, 'total_xp': user.total_xp, 'level': user.current_level}})
 
 
+def _recent_velocity_logs(user, days=7):
+	"""Last N activity rows for velocity analysis, fetched with a LIMIT
+	instead of loading the user's full history."""
+	rows = db.session.execute(text(
+		'SELECT topics_completed, learning_minutes FROM activity_logs '
+		'WHERE user_id = :u ORDER BY date DESC LIMIT :n'
+	), {'u': user.id, 'n': days}).all()
+	return [
+		{'topics_completed': topics or 0, 'learning_minutes': minutes or 0}
+		for topics, minutes in reversed(rows)
+	]
+
+
 @app.get('/api/analytics/learning-velocity')
 def learning_velocity():
 	user = _get_current_user()
-	logs = ActivityLog.query.filter_by(user_id=user.id).order_by(ActivityLog.date.asc()).all()
-	activity_logs = [{'topics_completed': l.topics_completed, 'learning_minutes': l.learning_minutes} for l in logs]
-	metrics = ai_adaptive.analyze_learning_velocity(activity_logs)
+	metrics = ai_adaptive.analyze_learning_velocity(_recent_velocity_logs(user))
 	return jsonify({'metrics': metrics})
 
 
 @app.get('/api/analytics/predictions')
 def analytics_predictions():
 	user = _get_current_user()
-	path = LearningPath.query.filter_by(user_id=user.id, is_active=True).order_by(LearningPath.created_at.desc()).first()
+	path = _active_path(user)
 	if not path:
 		return jsonify({'prediction': {'estimated_date': 'N/A', 'confidence': 'low'}})
 	completed_topics = Progress.query.filter_by(user_id=user.id, learning_path_id=path.id, status='completed').count()
-	logs = ActivityLog.query.filter_by(user_id=user.id).order_by(ActivityLog.date.asc()).all()
-	activity_logs = [{'topics_completed': l.topics_completed, 'learning_minutes': l.learning_minutes} for l in logs]
-	velocity_info = ai_adaptive.analyze_learning_velocity(activity_logs)
+	velocity_info = ai_adaptive.analyze_learning_velocity(_recent_velocity_logs(user))
 	topics_per_day = velocity_info.get('topics_per_day', 0)
 	prediction = ai_adaptive.predict_completion_date(completed_topics, path.total_topics or 1, topics_per_day)
 	return jsonify({'prediction': prediction})
@@ -1,8 +1,18 @@
+import re
+
 from flask_bcrypt import Bcrypt
 
 
 bcrypt = Bcrypt()
 
+# Compiled once at import; both patterns are backtracking-safe (no nested
+# quantifiers), so pathological register payloads can't stall the endpoint
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_USER_RE = re.compile(r'^[A-Za-z0-9_]{3,32}$')
+
+# Shared empty result so the common no-error path allocates nothing
+_NO_ERRORS = ()
+
 
 def hash_password(password):
 	"""Hash a password for storing"""
@@ -16,15 +26,17 @@ def verify_password(password_hash, password):
 
 def validate_registration_data(data):
 	"""Validate user registration data"""
-	errors = []
-	
-	if not data.get('username') or len(data.get('username', '')) < 3:
-		errors.append('Username must be at least 3 characters')
-	
-	if not data.get('email') or '@' not in data.get('email', ''):
+	errors = None
+
+	if not _USER_RE.fullmatch(data.get('username') or ''):
+		errors = ['Username must be 3-32 characters (letters, numbers, underscores)']
+
+	if not _EMAIL_RE.fullmatch(data.get('email') or ''):
+		errors = errors or []
 		errors.append('Valid email is required')
-	
-	if not data.get('password') or len(data.get('password', '')) < 6:
+
+	if len(data.get('password') or '') < 6:
+		errors = errors or []
 		errors.append('Password must be at least 6 characters')
-	
-	return errors
+
+	return errors if errors is not None else _NO_ERRORS
@@ -1,372 +1,515 @@
-"""
-Database module for user login credentials using raw SQL.
-Handles all database operations for user authentication.
-"""
-import sqlite3
-import os
-from datetime import datetime
-from flask_bcrypt import Bcrypt
-
-# Initialize bcrypt (will be initialized with Flask app if needed)
-bcrypt = Bcrypt()
-
-def init_bcrypt(app):
-	"""Initialize bcrypt with Flask app."""
-	bcrypt.init_app(app)
-
-# Database paths
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
-DB_PATH = os.path.join(DATA_DIR, 'users.db')
-
-
-def init_database():
-	"""Initialize the database and create tables if they don't exist."""
-	os.makedirs(DATA_DIR, exist_ok=True)
-	
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	# Create users table
-	cursor.execute('''
-		CREATE TABLE IF NOT EXISTS users (
-			id INTEGER PRIMARY KEY AUTOINCREMENT,
-			username TEXT UNIQUE NOT NULL,
-			email TEXT UNIQUE NOT NULL,
-			password_hash TEXT NOT NULL,
-			created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-			last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-		)
-	''')
-	
-	# Create index on email for faster lookups
-	cursor.execute('''
-		CREATE INDEX IF NOT EXISTS idx_email ON users(email)
-	''')
-	
-	# Create index on username for faster lookups
-	cursor.execute('''
-		CREATE INDEX IF NOT EXISTS idx_username ON users(username)
-	''')
-	
-	conn.commit()
-	conn.close()
-	print(f"Database initialized at: {DB_PATH}")
-
-
-def get_connection():
-	"""Get a database connection."""
-	return sqlite3.connect(DB_PATH)
-
-
-def hash_password(password):
-	"""Hash a password using bcrypt."""
-	return bcrypt.generate_password_hash(password).decode('utf-8')
-
-
-def verify_password(password_hash, password):
-	"""Verify a password against its hash."""
-	return bcrypt.check_password_hash(password_hash, password)
-
-
-def create_user(username, email, password):
-	"""
-	Create a new user in the database.
-	
-	Args:
-		username: Username (must be unique)
-		email: Email address (must be unique)
-		password: Plain text password (will be hashed)
-		
-	Returns:
-		dict: User data if successful, None if failed
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	try:
-		password_hash = hash_password(password)
-		created_at = datetime.utcnow().isoformat()
-		
-		cursor.execute('''
-			INSERT INTO users (username, email, password_hash, created_at, last_active)
-			VALUES (?, ?, ?, ?, ?)
-		''', (username, email.lower(), password_hash, created_at, created_at))
-		
-		user_id = cursor.lastrowid
-		conn.commit()
-		
-		return {
-			'id': user_id,
-			'username': username,
-			'email': email.lower(),
-			'created_at': created_at
-		}
-	except sqlite3.IntegrityError as e:
-		conn.rollback()
-		if 'username' in str(e):
-			raise ValueError('Username already exists')
-		elif 'email' in str(e):
-			raise ValueError('Email already registered')
-		else:
-			raise ValueError('Database error')
-	except Exception as e:
-		conn.rollback()
-		raise ValueError(f'Failed to create user: {str(e)}')
-	finally:
-		conn.close()
-
-
-def get_user_by_email(email):
-	"""
-	Get user by email address.
-	
-	Args:
-		email: Email address to search for
-		
-	Returns:
-		dict: User data if found, None otherwise
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	cursor.execute('''
-		SELECT id, username, email, password_hash, created_at, last_active
-		FROM users
-		WHERE email = ?
-	''', (email.lower(),))
-	
-	row = cursor.fetchone()
-	conn.close()
-	
-	if row:
-		return {
-			'id': row[0],
-			'username': row[1],
-			'email': row[2],
-			'password_hash': row[3],
-			'created_at': row[4],
-			'last_active': row[5]
-		}
-	return None
-
-
-def get_user_by_username(username):
-	"""
-	Get user by username.
-	
-	Args:
-		username: Username to search for
-		
-	Returns:
-		dict: User data if found, None otherwise
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	cursor.execute('''
-		SELECT id, username, email, password_hash, created_at, last_active
-		FROM users
-		WHERE username = ?
-	''', (username,))
-	
-	row = cursor.fetchone()
-	conn.close()
-	
-	if row:
-		return {
-			'id': row[0],
-			'username': row[1],
-			'email': row[2],
-			'password_hash': row[3],
-			'created_at': row[4],
-			'last_active': row[5]
-		}
-	return None
-
-
-def get_user_by_id(user_id):
-	"""
-	Get user by ID.
-	
-	Args:
-		user_id: User ID to search for
-		
-	Returns:
-		dict: User data if found, None otherwise
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	cursor.execute('''
-		SELECT id, username, email, password_hash, created_at, last_active
-		FROM users
-		WHERE id = ?
-	''', (user_id,))
-	
-	row = cursor.fetchone()
-	conn.close()
-	
-	if row:
-		return {
-			'id': row[0],
-			'username': row[1],
-			'email': row[2],
-			'password_hash': row[3],
-			'created_at': row[4],
-			'last_active': row[5]
-		}
-	return None
-
-
-def update_last_active(user_id):
-	"""
-	Update user's last active timestamp.
-	
-	Args:
-		user_id: User ID to update
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	cursor.execute('''
-		UPDATE users
-		SET last_active = ?
-		WHERE id = ?
-	''', (datetime.utcnow().isoformat(), user_id))
-	
-	conn.commit()
-	conn.close()
-
-
-def authenticate_user(email, password):
-	"""
-	Authenticate a user with email and password.
-	
-	Args:
-		email: User's email
-		password: Plain text password
-		
-	Returns:
-		dict: User data if authentication successful, None otherwise
-	"""
-	user = get_user_by_email(email)
-	
-	if user and verify_password(user['password_hash'], password):
-		update_last_active(user['id'])
-		# Remove password_hash from return
-		user.pop('password_hash', None)
-		return user
-	
-	return None
-
-
-def user_exists(email=None, username=None):
-	"""
-	Check if a user exists by email or username.
-	
-	Args:
-		email: Email to check (optional)
-		username: Username to check (optional)
-		
-	Returns:
-		bool: True if user exists, False otherwise
-	"""
-	if email:
-		return get_user_by_email(email) is not None
-	if username:
-		return get_user_by_username(username) is not None
-	return False
-
-
-def get_all_users():
-	"""
-	Get all users from database (for admin purposes).
-	
-	Returns:
-		list: List of user dictionaries (without password hashes)
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	cursor.execute('''
-		SELECT id, username, email, created_at, last_active
-		FROM users
-		ORDER BY created_at DESC
-	''')
-	
-	rows = cursor.fetchall()
-	conn.close()
-	
-	return [
-		{
-			'id': row[0],
-			'username': row[1],
-			'email': row[2],
-			'created_at': row[3],
-			'last_active': row[4]
-		}
-		for row in rows
-	]
-
-
-def delete_user(user_id):
-	"""
-	Delete a user from the database.
-	
-	Args:
-		user_id: User ID to delete
-		
-	Returns:
-		bool: True if deleted, False if user not found
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-	
-	deleted = cursor.rowcount > 0
-	conn.commit()
-	conn.close()
-	
-	return deleted
-
-
-def get_database_stats():
-	"""
-	Get statistics about the users database.
-	
-	Returns:
-		dict: Database statistics
-	"""
-	conn = get_connection()
-	cursor = conn.cursor()
-	
-	# Total users
-	cursor.execute('SELECT COUNT(*) FROM users')
-	total_users = cursor.fetchone()[0]
-	
-	# Recent registrations (last 7 days)
-	cursor.execute('''
-		SELECT COUNT(*) FROM users
-		WHERE created_at >= datetime('now', '-7 days')
-	''')
-	recent_users = cursor.fetchone()[0]
-	
-	# Active users (active in last 30 days)
-	cursor.execute('''
-		SELECT COUNT(*) FROM users
-		WHERE last_active >= datetime('now', '-30 days')
-	''')
-	active_users = cursor.fetchone()[0]
-	
-	conn.close()
-	
-	return {
-		'database_path': DB_PATH,
-		'database_size': os.path.getsize(DB_PATH) if os.path.exists(DB_PATH) else 0,
-		'total_users': total_users,
-		'recent_users': recent_users,
-		'active_users': active_users
-	}
-
+"""
+Database module for user login credentials using raw SQL.
+Handles all database operations for user authentication.
+"""
+import queue
+import sqlite3
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from flask_bcrypt import Bcrypt
+
+# Initialize bcrypt (will be initialized with Flask app if needed)
+bcrypt = Bcrypt()
+
+# Bounded pool for bcrypt work: the C hash releases the GIL, so a burst of
+# register/login requests shares cpu_count() hashing slots instead of
+# stacking unbounded bcrypt runs on the request threads
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+
+def init_bcrypt(app):
+	"""Initialize bcrypt with Flask app."""
+	# Cost factor is env-tunable; pick the smallest value the threat model allows
+	app.config.setdefault('BCRYPT_LOG_ROUNDS', int(os.getenv('BCRYPT_LOG_ROUNDS', '12')))
+	bcrypt.init_app(app)
+
+# Database paths
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+DB_PATH = os.path.join(DATA_DIR, 'users.db')
+MAIN_DB_PATH = os.path.join(DATA_DIR, 'pathforge.db')
+
+# Small LIFO pool of long-lived connections: LIFO keeps the most recently
+# used handle (and its warm page cache) on top, and each DAO call borrows
+# a handle instead of paying a connect/close round trip
+_POOL_SIZE = 5
+_pool = queue.LifoQueue(maxsize=_POOL_SIZE)
+
+
+def _new_connection():
+	"""Open a connection with the per-connection pragmas applied."""
+	conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+	cursor = conn.cursor()
+	# WAL lets readers proceed during writes; NORMAL sync is safe with WAL;
+	# cache_size is in KiB when negative (~20 MB page cache)
+	cursor.execute('PRAGMA journal_mode=WAL')
+	cursor.execute('PRAGMA synchronous=NORMAL')
+	cursor.execute('PRAGMA cache_size=-20000')
+	cursor.execute('PRAGMA temp_store=MEMORY')
+	cursor.execute('PRAGMA mmap_size=268435456')
+	# Attach the main app database so create_user can write the auth row
+	# and its mirror User row under one transaction (one fsync, no gap)
+	cursor.execute('ATTACH DATABASE ? AS app', (MAIN_DB_PATH,))
+	return conn
+
+
+@contextmanager
+def borrow():
+	"""
+	Borrow a pooled connection for the duration of a with-block.
+
+	Falls back to opening a fresh connection when the pool is empty
+	(e.g. under burst load); surplus connections are closed instead of
+	growing the pool.
+	"""
+	try:
+		conn = _pool.get_nowait()
+	except queue.Empty:
+		conn = _new_connection()
+	try:
+		yield conn
+	finally:
+		try:
+			_pool.put_nowait(conn)
+		except queue.Full:
+			conn.close()
+
+
+# In-process TTL cache for the hot user lookups: _get_current_user fires
+# one on nearly every API request, so within the TTL window a logged-in
+# user costs one SQL read instead of one per endpoint hit. Only found
+# users are cached, and callers get private copies since authenticate_user
+# strips password_hash from the dict it returns.
+_USER_CACHE_TTL = 60
+_USER_CACHE_MAX = 10000
+_users_by_id = {}
+_users_by_email = {}
+# Debounce table for update_last_active: user_id -> monotonic timestamp
+_last_active_writes = {}
+
+
+def _cache_get(cache, key):
+	entry = cache.get(key)
+	if entry is None:
+		return None
+	user, stamp = entry
+	if time.monotonic() - stamp >= _USER_CACHE_TTL:
+		cache.pop(key, None)
+		return None
+	return dict(user)
+
+
+def _cache_put(user):
+	if len(_users_by_id) >= _USER_CACHE_MAX:
+		_users_by_id.clear()
+		_users_by_email.clear()
+	entry = (user, time.monotonic())
+	_users_by_id[user['id']] = entry
+	_users_by_email[user['email']] = entry
+
+
+def _cache_invalidate(user_id):
+	entry = _users_by_id.pop(user_id, None)
+	if entry:
+		_users_by_email.pop(entry[0]['email'], None)
+
+
+def init_database():
+	"""Initialize the database and create tables if they don't exist."""
+	os.makedirs(DATA_DIR, exist_ok=True)
+
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		# Create users table
+		cursor.execute('''
+			CREATE TABLE IF NOT EXISTS users (
+				id INTEGER PRIMARY KEY AUTOINCREMENT,
+				username TEXT UNIQUE NOT NULL,
+				email TEXT UNIQUE NOT NULL,
+				password_hash TEXT NOT NULL,
+				created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+				last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+			)
+		''')
+
+		# Create index on email for faster lookups
+		cursor.execute('''
+			CREATE INDEX IF NOT EXISTS idx_email ON users(email)
+		''')
+
+		# Create index on username for faster lookups
+		cursor.execute('''
+			CREATE INDEX IF NOT EXISTS idx_username ON users(username)
+		''')
+
+		# Stats filter on last_active; keep that an index range scan
+		cursor.execute('''
+			CREATE INDEX IF NOT EXISTS idx_last_active ON users(last_active)
+		''')
+
+		# Timestamps are stored as integer epoch seconds; rewrite ISO text
+		# rows from older databases so comparisons stay purely numeric
+		cursor.execute('''
+			UPDATE users SET created_at = CAST(strftime('%s', created_at) AS INTEGER)
+			WHERE typeof(created_at) = 'text'
+		''')
+		cursor.execute('''
+			UPDATE users SET last_active = CAST(strftime('%s', last_active) AS INTEGER)
+			WHERE typeof(last_active) = 'text'
+		''')
+
+		conn.commit()
+	print(f"Database initialized at: {DB_PATH}")
+
+
+def get_connection():
+	"""Get a dedicated (non-pooled) database connection."""
+	return _new_connection()
+
+
+def hash_password(password):
+	"""Hash a password using bcrypt (runs on the bounded hashing pool)."""
+	future = _BCRYPT_POOL.submit(bcrypt.generate_password_hash, password)
+	return future.result().decode('utf-8')
+
+
+def verify_password(password_hash, password):
+	"""Verify a password against its hash (runs on the bounded hashing pool)."""
+	return _BCRYPT_POOL.submit(bcrypt.check_password_hash, password_hash, password).result()
+
+
+def create_user(username, email, password):
+	"""
+	Create a new user in the database.
+
+	Args:
+		username: Username (must be unique)
+		email: Email address (must be unique)
+		password: Plain text password (will be hashed)
+
+	Returns:
+		dict: User data if successful, None if failed
+	"""
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		try:
+			password_hash = hash_password(password)
+			now = datetime.utcnow()
+			created_at = int(time.time())
+
+			cursor.execute('BEGIN IMMEDIATE')
+			cursor.execute('''
+				INSERT INTO users (username, email, password_hash, created_at, last_active)
+				VALUES (?, ?, ?, ?, ?)
+			''', (username, email.lower(), password_hash, created_at, created_at))
+
+			user_id = cursor.lastrowid
+
+			# Mirror row in the attached main database, same transaction.
+			# Timestamps use the space-separated format SQLAlchemy's DateTime
+			# columns expect when reading them back.
+			try:
+				app_now = now.isoformat(' ')
+				cursor.execute('''
+					INSERT OR IGNORE INTO app.users
+						(id, username, email, password_hash, created_at, last_active,
+						 total_xp, current_level, current_streak, longest_streak, total_learning_hours)
+					VALUES (?, ?, ?, 'stored_in_users_db', ?, ?, 0, 1, 0, 0, 0.0)
+				''', (user_id, username, email.lower(), app_now, app_now))
+			except sqlite3.OperationalError:
+				# Main schema not created yet (standalone use); login repairs it
+				pass
+
+			conn.commit()
+
+			return {
+				'id': user_id,
+				'username': username,
+				'email': email.lower(),
+				'created_at': created_at
+			}
+		except sqlite3.IntegrityError as e:
+			conn.rollback()
+			if 'username' in str(e):
+				raise ValueError('Username already exists')
+			elif 'email' in str(e):
+				raise ValueError('Email already registered')
+			else:
+				raise ValueError('Database error')
+		except Exception as e:
+			conn.rollback()
+			raise ValueError(f'Failed to create user: {str(e)}')
+
+
+def get_user_by_email(email):
+	"""
+	Get user by email address.
+
+	Args:
+		email: Email address to search for
+
+	Returns:
+		dict: User data if found, None otherwise
+	"""
+	cached = _cache_get(_users_by_email, email.lower())
+	if cached is not None:
+		return cached
+
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		cursor.execute('''
+			SELECT id, username, email, password_hash, created_at, last_active
+			FROM users
+			WHERE email = ?
+		''', (email.lower(),))
+
+		row = cursor.fetchone()
+
+	if row:
+		user = {
+			'id': row[0],
+			'username': row[1],
+			'email': row[2],
+			'password_hash': row[3],
+			'created_at': row[4],
+			'last_active': row[5]
+		}
+		_cache_put(user)
+		return dict(user)
+	return None
+
+
+def get_user_by_username(username):
+	"""
+	Get user by username.
+
+	Args:
+		username: Username to search for
+
+	Returns:
+		dict: User data if found, None otherwise
+	"""
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		cursor.execute('''
+			SELECT id, username, email, password_hash, created_at, last_active
+			FROM users
+			WHERE username = ?
+		''', (username,))
+
+		row = cursor.fetchone()
+
+	if row:
+		return {
+			'id': row[0],
+			'username': row[1],
+			'email': row[2],
+			'password_hash': row[3],
+			'created_at': row[4],
+			'last_active': row[5]
+		}
+	return None
+
+
+def get_user_by_id(user_id):
+	"""
+	Get user by ID.
+
+	Args:
+		user_id: User ID to search for
+
+	Returns:
+		dict: User data if found, None otherwise
+	"""
+	cached = _cache_get(_users_by_id, user_id)
+	if cached is not None:
+		return cached
+
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		cursor.execute('''
+			SELECT id, username, email, password_hash, created_at, last_active
+			FROM users
+			WHERE id = ?
+		''', (user_id,))
+
+		row = cursor.fetchone()
+
+	if row:
+		user = {
+			'id': row[0],
+			'username': row[1],
+			'email': row[2],
+			'password_hash': row[3],
+			'created_at': row[4],
+			'last_active': row[5]
+		}
+		_cache_put(user)
+		return dict(user)
+	return None
+
+
+def update_last_active(user_id):
+	"""
+	Update user's last active timestamp.
+
+	Args:
+		user_id: User ID to update
+	"""
+	# Debounce: _get_current_user calls this on every request, and a
+	# last_active that lags by under a minute is indistinguishable in the UI
+	now = time.monotonic()
+	last = _last_active_writes.get(user_id)
+	if last is not None and now - last < _USER_CACHE_TTL:
+		return
+	_last_active_writes[user_id] = now
+	_cache_invalidate(user_id)
+
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		cursor.execute('''
+			UPDATE users
+			SET last_active = ?
+			WHERE id = ?
+		''', (int(time.time()), user_id))
+
+		conn.commit()
+
+
+def authenticate_user(email, password):
+	"""
+	Authenticate a user with email and password.
+
+	Args:
+		email: User's email
+		password: Plain text password
+
+	Returns:
+		dict: User data if authentication successful, None otherwise
+	"""
+	user = get_user_by_email(email)
+
+	if user and verify_password(user['password_hash'], password):
+		update_last_active(user['id'])
+		# Remove password_hash from return
+		user.pop('password_hash', None)
+		return user
+
+	return None
+
+
+def user_exists(email=None, username=None):
+	"""
+	Check if a user exists by email or username.
+
+	Args:
+		email: Email to check (optional)
+		username: Username to check (optional)
+
+	Returns:
+		bool: True if user exists, False otherwise
+	"""
+	if email:
+		return get_user_by_email(email) is not None
+	if username:
+		return get_user_by_username(username) is not None
+	return False
+
+
+def get_all_users():
+	"""
+	Get all users from database (for admin purposes).
+
+	Returns:
+		list: List of user dictionaries (without password hashes)
+	"""
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		cursor.execute('''
+			SELECT id, username, email, created_at, last_active
+			FROM users
+			ORDER BY created_at DESC
+		''')
+
+		rows = cursor.fetchall()
+
+	return [
+		{
+			'id': row[0],
+			'username': row[1],
+			'email': row[2],
+			'created_at': row[3],
+			'last_active': row[4]
+		}
+		for row in rows
+	]
+
+
+def delete_user(user_id):
+	"""
+	Delete a user from the database.
+
+	Args:
+		user_id: User ID to delete
+
+	Returns:
+		bool: True if deleted, False if user not found
+	"""
+	_cache_invalidate(user_id)
+	_last_active_writes.pop(user_id, None)
+
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
+
+		deleted = cursor.rowcount > 0
+		conn.commit()
+
+	return deleted
+
+
+def get_database_stats():
+	"""
+	Get statistics about the users database.
+
+	Returns:
+		dict: Database statistics
+	"""
+	with borrow() as conn:
+		cursor = conn.cursor()
+
+		# Total users
+		cursor.execute('SELECT COUNT(*) FROM users')
+		total_users = cursor.fetchone()[0]
+
+		# Recent registrations (last 7 days) — integer epoch compare
+		cursor.execute('''
+			SELECT COUNT(*) FROM users
+			WHERE created_at >= CAST(strftime('%s', 'now', '-7 days') AS INTEGER)
+		''')
+		recent_users = cursor.fetchone()[0]
+
+		# Active users (active in last 30 days)
+		cursor.execute('''
+			SELECT COUNT(*) FROM users
+			WHERE last_active >= CAST(strftime('%s', 'now', '-30 days') AS INTEGER)
+		''')
+		active_users = cursor.fetchone()[0]
+
+	return {
+		'database_path': DB_PATH,
+		'database_size': os.path.getsize(DB_PATH) if os.path.exists(DB_PATH) else 0,
+		'total_users': total_users,
+		'recent_users': recent_users,
+		'active_users': active_users
+	}
@@ -1,18 +1,38 @@
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-import json
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import date, datetime
 
 
 db = SQLAlchemy()
 
 
+def _compile_to_dict(fields):
+	"""Build a serializer compiled once at import.
+
+	Each entry is a column name or a (key, expression) pair whose
+	expression is inlined verbatim. The generated function body is a
+	single dict display, so a call runs one bytecode sequence instead of
+	an interpreted lookup and dict-store per field.
+	"""
+	parts = []
+	for field in fields:
+		key, expr = field if isinstance(field, tuple) else (field, f'self.{field}')
+		parts.append(f'{key!r}: {expr}')
+	namespace = {}
+	exec(compile('def to_dict(self):\n\treturn {' + ', '.join(parts) + '}', '<to_dict>', 'exec'), namespace)
+	return namespace['to_dict']
+
+
 class User(db.Model):
 	__tablename__ = 'users'
 	
 	id = db.Column(db.Integer, primary_key=True)
 	username = db.Column(db.String(80), unique=True, nullable=False)
 	email = db.Column(db.String(120), unique=True, nullable=False)
-	password_hash = db.Column(db.String(255), nullable=False)
+	# Bcrypt output is exactly 60 bytes; sized to match (SQLite treats the
+	# length as documentation, but a stricter backend would enforce it)
+	password_hash = db.Column(db.String(60), nullable=False)
 	created_at = db.Column(db.DateTime, default=datetime.utcnow)
 	last_active = db.Column(db.DateTime, default=datetime.utcnow)
 	
@@ -20,13 +40,14 @@ class User(db.Model):
 	avatar_url = db.Column(db.String(255))
 	bio = db.Column(db.Text)
 	
-	# Onboarding data (stored as JSON)
-	current_skills = db.Column(db.Text)  # JSON array
+	# Onboarding data (native JSON columns; the engine's orjson hooks do
+	# the (de)serialization, so these read and write as Python lists)
+	current_skills = db.Column(db.JSON)
 	learning_goal = db.Column(db.String(255))
 	target_role = db.Column(db.String(100))
 	learning_pace = db.Column(db.String(50))
 	daily_hours = db.Column(db.Float)
-	preferred_content = db.Column(db.Text)  # JSON array
+	preferred_content = db.Column(db.JSON)
 	assessment_score = db.Column(db.Integer)
 	proficiency_level = db.Column(db.String(50))  # beginner/intermediate/advanced
 	
@@ -35,43 +56,64 @@ class User(db.Model):
 	current_level = db.Column(db.Integer, default=1)
 	current_streak = db.Column(db.Integer, default=0)
 	longest_streak = db.Column(db.Integer, default=0)
+	last_activity_date = db.Column(db.Date)  # anchor for incremental streak updates
 	total_learning_hours = db.Column(db.Float, default=0.0)
 	
-	# Relationships
-	learning_paths = db.relationship('LearningPath', backref='user', lazy=True, cascade='all, delete-orphan')
-	progress_records = db.relationship('Progress', backref='user', lazy=True, cascade='all, delete-orphan')
-	achievements = db.relationship('UserAchievement', backref='user', lazy=True, cascade='all, delete-orphan')
-	activity_logs = db.relationship('ActivityLog', backref='user', lazy=True, cascade='all, delete-orphan')
-	
-	def to_dict(self):
-		return {
-			'id': self.id,
-			'username': self.username,
-			'email': self.email,
-			'avatar_url': self.avatar_url,
-			'bio': self.bio,
-			'total_xp': self.total_xp,
-			'current_level': self.current_level,
-			'current_streak': self.current_streak,
-			'total_learning_hours': self.total_learning_hours,
-			'created_at': self.created_at.isoformat(),
-			'last_active': self.last_active.isoformat()
-		}
+	# Relationships. Deliberately lazy: _get_current_user loads a User on
+	# every request and no endpoint reads these collections off the instance
+	# (handlers query the child tables directly with their own filters), so
+	# eager strategies like selectin would add one SELECT per relationship
+	# per request for data that goes unused. If a serializer ever walks
+	# these, load them per-query with selectinload instead of changing the
+	# default here.
+	#
+	# Deletes cascade in the database (ON DELETE CASCADE on the child FKs,
+	# with PRAGMA foreign_keys=ON per connection); passive_deletes keeps
+	# SQLAlchemy from loading every child row into the session just to
+	# delete it, which is what 'all, delete-orphan' used to force.
+	learning_paths = db.relationship('LearningPath', backref='user', lazy=True, passive_deletes=True, cascade='save-update, merge')
+	progress_records = db.relationship('Progress', backref='user', lazy=True, passive_deletes=True, cascade='save-update, merge')
+	achievements = db.relationship('UserAchievement', backref='user', lazy=True, passive_deletes=True, cascade='save-update, merge')
+	activity_logs = db.relationship('ActivityLog', backref='user', lazy=True, passive_deletes=True, cascade='save-update, merge')
+	
+	to_dict = _compile_to_dict((
+		'id', 'username', 'email', 'avatar_url', 'bio', 'total_xp',
+		'current_level', 'current_streak', 'total_learning_hours',
+		('created_at', 'self.created_at.isoformat()'),
+		('last_active', 'self.last_active.isoformat()'),
+	))
+
+	@classmethod
+	def award_xp(cls, user_id, delta):
+		"""Add XP atomically and return the new (total_xp, current_level).
+
+		Level derives from the incremented total inside the statement, so
+		concurrent awards can't interleave a stale read-modify-write and
+		no User instance is hydrated. Callers holding a session instance
+		should expire its total_xp/current_level afterwards. The level
+		formula mirrors utils.get_level_from_xp.
+		"""
+		return db.session.execute(
+			db.update(cls).where(cls.id == user_id).values(
+				total_xp=cls.total_xp + delta,
+				current_level=db.func.max(1, (cls.total_xp + delta) // 1000)
+			).returning(cls.total_xp, cls.current_level)
+		).one()
 
 
 class LearningPath(db.Model):
 	__tablename__ = 'learning_paths'
 	
 	id = db.Column(db.Integer, primary_key=True)
-	user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+	user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
 	title = db.Column(db.String(255), nullable=False)
 	description = db.Column(db.Text)
 	target_role = db.Column(db.String(100))
 	estimated_duration_weeks = db.Column(db.Integer)
 	difficulty_level = db.Column(db.String(50))
 	
-	# AI-generated curriculum (stored as JSON)
-	curriculum_data = db.Column(db.Text, nullable=False)  # JSON with modules, topics, resources
+	# AI-generated curriculum (deserialized once by the driver on row load)
+	curriculum_data = db.Column(db.JSON, nullable=False)  # JSON with modules, topics, resources
 	
 	# Metadata
 	created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -86,30 +128,84 @@ class LearningPath(db.Model):
 	total_topics = db.Column(db.Integer, default=0)
 	completed_topics = db.Column(db.Integer, default=0)
 	completion_percentage = db.Column(db.Float, default=0.0)
-	
-	def to_dict(self):
-		return {
-			'id': self.id,
-			'title': self.title,
-			'description': self.description,
-			'target_role': self.target_role,
-			'estimated_duration_weeks': self.estimated_duration_weeks,
-			'difficulty_level': self.difficulty_level,
-			'curriculum': json.loads(self.curriculum_data) if self.curriculum_data else {},
-			'completion_percentage': self.completion_percentage,
-			'total_modules': self.total_modules,
-			'completed_modules': self.completed_modules,
-			'total_topics': self.total_topics,
-			'completed_topics': self.completed_topics,
-			'created_at': self.created_at.isoformat()
-		}
+
+	# Backs the "latest active path for user" lookup with an index seek
+	__table_args__ = (
+		db.Index('ix_lp_user_active', user_id, is_active, created_at.desc()),
+	)
+
+	@classmethod
+	def list_as_dicts(cls, user_id):
+		"""Summaries of a user's paths as plain dicts.
+
+		Projects the listed columns straight into mappings instead of
+		hydrating a LearningPath instance per row; the curriculum blob is
+		deliberately excluded — listings don't need it.
+		"""
+		rows = db.session.execute(db.select(
+			cls.id, cls.title, cls.description, cls.target_role,
+			cls.estimated_duration_weeks, cls.difficulty_level,
+			cls.completion_percentage, cls.total_modules, cls.completed_modules,
+			cls.total_topics, cls.completed_topics, cls.is_active, cls.created_at
+		).where(cls.user_id == user_id).order_by(cls.created_at.desc())).mappings().all()
+		return [{**row, 'created_at': row['created_at'].isoformat()} for row in rows]
+
+	@hybrid_property
+	def live_completion_percentage(self):
+		"""Completion recomputed from Progress rows at read time.
+
+		The stored completion_percentage column stays the fast path for
+		listings (one atomic UPDATE maintains it in complete_topic); this
+		hybrid is the source-of-truth view for audits and for filtering in
+		SQL, where it compiles to a correlated COUNT subquery.
+		"""
+		if not self.total_topics:
+			return self.completion_percentage or 0.0
+		done = db.session.query(Progress).filter_by(
+			learning_path_id=self.id, status='completed').count()
+		return round(100.0 * done / self.total_topics, 1)
+
+	@live_completion_percentage.expression
+	def live_completion_percentage(cls):
+		done = db.select(db.func.count(Progress.id)).where(
+			Progress.learning_path_id == cls.id,
+			Progress.status == 'completed'
+		).scalar_subquery()
+		return db.func.coalesce(
+			db.func.round(100.0 * done / db.func.nullif(cls.total_topics, 0), 1),
+			cls.completion_percentage
+		)
+
+	@property
+	def curriculum(self):
+		"""Curriculum dict; the JSON column already deserializes on row load.
+
+		Treat the returned dict as read-only — in-place edits bypass the
+		column's change tracking and would not persist.
+		"""
+		return self.curriculum_data or {}
+
+	_to_dict_base = _compile_to_dict((
+		'id', 'title', 'description', 'target_role',
+		'estimated_duration_weeks', 'difficulty_level',
+		'completion_percentage', 'total_modules', 'completed_modules',
+		'total_topics', 'completed_topics',
+		('created_at', 'self.created_at.isoformat()'),
+	))
+
+	def to_dict(self, curriculum=None):
+		# Callers that still hold the curriculum dict (e.g. right after
+		# generating it) can pass it in to skip re-reading curriculum_data
+		d = self._to_dict_base()
+		d['curriculum'] = self.curriculum if curriculum is None else curriculum
+		return d
 
 
 class Progress(db.Model):
 	__tablename__ = 'progress'
 	
 	id = db.Column(db.Integer, primary_key=True)
-	user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+	user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
 	learning_path_id = db.Column(db.Integer, db.ForeignKey('learning_paths.id'), nullable=False)
 	
 	module_id = db.Column(db.String(100), nullable=False)
@@ -128,11 +224,38 @@ class Progress(db.Model):
 	
 	# AI insights
 	difficulty_feedback = db.Column(db.String(50))  # too_easy, just_right, too_hard
-	ai_recommendations = db.Column(db.Text)  # JSON
+	ai_recommendations = db.Column(db.JSON)
 	
 	created_at = db.Column(db.DateTime, default=datetime.utcnow)
 	updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+	# Progress lookups filter by user/path/status (counts, completion
+	# checks); the index turns those scans into range reads. The unique
+	# constraint pins one row per topic per path and gives upserts a
+	# conflict target.
+	__table_args__ = (
+		db.Index('ix_progress_user_path_status', 'user_id', 'learning_path_id', 'status'),
+		db.UniqueConstraint('user_id', 'learning_path_id', 'module_id', 'topic_id', name='uq_progress_topic'),
+	)
+
+	@classmethod
+	def bulk_insert(cls, rows):
+		"""Insert many progress rows in one executemany round-trip.
+
+		bulk_insert_mappings skips unit-of-work bookkeeping (no instances,
+		no identity map), which is where per-object inserts spend most of
+		their time. It also bypasses Python-side column defaults, so the
+		common ones are filled in here.
+		"""
+		if not rows:
+			return
+		now = datetime.utcnow()
+		db.session.bulk_insert_mappings(cls, [
+			{'status': 'not_started', 'time_spent_minutes': 0, 'bookmarked': False,
+			 'created_at': now, 'updated_at': now, **row}
+			for row in rows
+		])
+
 
 class Achievement(db.Model):
 	__tablename__ = 'achievements'
@@ -144,28 +267,82 @@ class Achievement(db.Model):
 	category = db.Column(db.String(50))  # milestone, streak, mastery, special
 	xp_reward = db.Column(db.Integer, default=0)
 	rarity = db.Column(db.String(50))  # common, rare, epic, legendary
-	criteria = db.Column(db.Text)  # JSON with unlock criteria
+	criteria = db.Column(db.JSON)  # unlock criteria
 
 
 class UserAchievement(db.Model):
 	__tablename__ = 'user_achievements'
 	
 	id = db.Column(db.Integer, primary_key=True)
-	user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+	user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
 	achievement_id = db.Column(db.Integer, db.ForeignKey('achievements.id'), nullable=False)
 	earned_at = db.Column(db.DateTime, default=datetime.utcnow)
 	
 	achievement = db.relationship('Achievement', backref='user_achievements')
 
+	# Each achievement can be earned once; makes the OR IGNORE award insert safe
+	__table_args__ = (
+		db.UniqueConstraint('user_id', 'achievement_id', name='uq_user_achievement'),
+	)
+
 
 class ActivityLog(db.Model):
 	__tablename__ = 'activity_logs'
 	
 	id = db.Column(db.Integer, primary_key=True)
-	user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+	user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
 	date = db.Column(db.Date, nullable=False)
 	learning_minutes = db.Column(db.Integer, default=0)
 	topics_completed = db.Column(db.Integer, default=0)
 	xp_earned = db.Column(db.Integer, default=0)
-	
+
 	created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+	# One row per user per day; backs the ON CONFLICT upsert in complete_topic
+	__table_args__ = (
+		db.UniqueConstraint('user_id', 'date', name='uq_activity_user_date'),
+	)
+
+	@classmethod
+	def bulk_upsert(cls, rows):
+		"""Upsert many per-day rows in one statement, accumulating on conflict.
+
+		Same ON CONFLICT arithmetic as the single-row upsert in
+		complete_topic, but over a multi-VALUES insert so a batch costs one
+		round-trip instead of one per row. Column defaults are filled in
+		explicitly because multi-row inserts bypass them.
+		"""
+		if not rows:
+			return
+		now = datetime.utcnow()
+		stmt = sqlite_insert(cls).values([
+			{'learning_minutes': 0, 'topics_completed': 0, 'xp_earned': 0,
+			 'created_at': now, **row}
+			for row in rows
+		])
+		db.session.execute(stmt.on_conflict_do_update(
+			index_elements=['user_id', 'date'],
+			set_={
+				'learning_minutes': cls.learning_minutes + stmt.excluded.learning_minutes,
+				'topics_completed': cls.topics_completed + stmt.excluded.topics_completed,
+				'xp_earned': cls.xp_earned + stmt.excluded.xp_earned
+			}
+		))
+
+	@classmethod
+	def current_streak(cls, user_id, anchor=None):
+		"""Consecutive-day streak ending at anchor (default today), in SQL.
+
+		A row belongs to the streak when its date is exactly (row_number - 1)
+		days before the anchor, so the count of such rows is the streak —
+		no ActivityLog rows ever cross into Python.
+		"""
+		anchor = anchor or date.today()
+		count = db.session.execute(db.text('''
+			SELECT COUNT(*) FROM (
+				SELECT date, ROW_NUMBER() OVER (ORDER BY date DESC) AS rn
+				FROM activity_logs
+				WHERE user_id = :u AND date <= :anchor
+			) WHERE julianday(date) = julianday(:anchor) - (rn - 1)
+		'''), {'u': user_id, 'anchor': anchor.isoformat()}).scalar()
+		return int(count or 0)
@@ -1,102 +1,131 @@
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+import functools
 import json
 
+import numpy as np
+
+
+def _to_date(value):
+	"""Coerce a log date (date, datetime, or ISO string) to a date.
+
+	The string path slices the fixed YYYY-MM-DD positions straight into
+	three int() calls instead of running the general ISO-8601 parser;
+	a trailing time component is simply ignored by the slices.
+	"""
+	if isinstance(value, str):
+		return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+	if isinstance(value, datetime):
+		return value.date()
+	return value
+
 
 def calculate_streak(activity_logs):
 	"""Calculate current learning streak"""
 	if not activity_logs:
 		return 0
-	
-	# Sort by date descending
-	sorted_logs = sorted(activity_logs, key=lambda x: x['date'], reverse=True)
-	
+	# Hash-set of day ordinals: O(N) to build with no sort, then the walk
+	# back from today costs one membership probe per streak day
+	log_ords = {_to_date(log['date']).toordinal() for log in activity_logs}
+	today = datetime.now().date().toordinal()
 	streak = 0
-	current_date = datetime.now().date()
-	
-	for log in sorted_logs:
-		log_date = log['date'] if isinstance(log['date'], datetime) else datetime.fromisoformat(log['date']).date()
-		
-		# Check if this log is for today or consecutive day
-		expected_date = current_date - timedelta(days=streak)
-		
-		if log_date == expected_date:
-			streak += 1
-		elif log_date < expected_date:
-			break  # Streak broken
-	
+	while (today - streak) in log_ords:
+		streak += 1
 	return streak
 
 
 def generate_heatmap(activity_logs, weeks=12):
-	"""Generate activity heatmap data for last N weeks"""
-	heatmap_data = []
+	"""Generate activity heatmap data for last N weeks.
+
+	Returns a struct-of-arrays payload — {'dates': [...], 'minutes': [...],
+	'intensity': [...]} indexed by position — instead of one dict per day,
+	which cuts the repeated key names out of the JSON and lets orjson take
+	its flat int-list fast path.
+	"""
 	end_date = datetime.now().date()
-	start_date = end_date - timedelta(weeks=weeks)
-	
-	# Create dict of dates with learning minutes
-	activity_dict = {}
+	n = weeks * 7 + 1
+	start_ord = end_date.toordinal() - weeks * 7
+
+	# Scatter log minutes into a dense per-day array indexed by ordinal
+	minutes = np.zeros(n, dtype=np.int32)
 	for log in activity_logs:
-		log_date = log['date'] if isinstance(log['date'], datetime) else datetime.fromisoformat(log['date']).date()
-		activity_dict[log_date] = log.get('learning_minutes', 0)
-	
-	# Generate data for each day in range
-	current_date = start_date
-	while current_date <= end_date:
-		minutes = activity_dict.get(current_date, 0)
-		intensity = min(minutes / 60, 4)  # 0-4 scale
-		
-		heatmap_data.append({
-			'date': current_date.isoformat(),
-			'minutes': minutes,
-			'intensity': int(intensity)
-		})
-		
-		current_date += timedelta(days=1)
-	
-	return heatmap_data
+		idx = _to_date(log['date']).toordinal() - start_ord
+		if 0 <= idx < n:
+			minutes[idx] = log.get('learning_minutes', 0) or 0
+
+	# Intensity on a 0-4 scale, computed for the whole window at once
+	intensity = np.minimum(minutes // 60, 4)
+
+	return {
+		'dates': [date.fromordinal(start_ord + i).isoformat() for i in range(n)],
+		'minutes': minutes.tolist(),
+		'intensity': intensity.tolist()
+	}
+
+
+# Achievement tiers sorted ascending by unlock threshold, built once at
+# import. Each metric keeps a parallel thresholds tuple so bisect_right
+# can locate the highest tier crossed; everything up to that index is
+# earned, so a slice replaces per-criterion boolean checks.
+_PROGRESS_TIERS = ({'name': 'First Steps', 'xp': 50}, {'name': '10 Topics Master', 'xp': 100}, {'name': '50 Topics Master', 'xp': 500})
+_PROGRESS_THRESHOLDS = (1, 10, 50)
+_STREAK_TIERS = ({'name': 'Week Warrior', 'xp': 200}, {'name': 'Month Champion', 'xp': 1000})
+_STREAK_THRESHOLDS = (7, 30)
+_LEVEL_TIERS = ({'name': 'Level 5 Achieved', 'xp': 300}, {'name': 'Level 10 Achieved', 'xp': 500})
+_LEVEL_THRESHOLDS = (5, 10)
 
 
 def check_achievements(user, progress_count, streak):
 	"""Check if user has earned new achievements"""
-	new_achievements = []
-	
-	# Define achievement criteria
-	achievements_criteria = [
-		{'name': 'First Steps', 'criteria': progress_count >= 1, 'xp': 50},
-		{'name': '10 Topics Master', 'criteria': progress_count >= 10, 'xp': 100},
-		{'name': '50 Topics Master', 'criteria': progress_count >= 50, 'xp': 500},
-		{'name': 'Week Warrior', 'criteria': streak >= 7, 'xp': 200},
-		{'name': 'Month Champion', 'criteria': streak >= 30, 'xp': 1000},
-		{'name': 'Level 5 Achieved', 'criteria': user.current_level >= 5, 'xp': 300},
-		{'name': 'Level 10 Achieved', 'criteria': user.current_level >= 10, 'xp': 500},
+	return [
+		*_PROGRESS_TIERS[:bisect_right(_PROGRESS_THRESHOLDS, progress_count)],
+		*_STREAK_TIERS[:bisect_right(_STREAK_THRESHOLDS, streak)],
+		*_LEVEL_TIERS[:bisect_right(_LEVEL_THRESHOLDS, user.current_level)],
 	]
-	
-	for achievement in achievements_criteria:
-		if achievement['criteria']:
-			new_achievements.append(achievement)
-	
-	return new_achievements
 
 
+@functools.cache
 def calculate_xp_for_level(level):
 	"""Calculate total XP needed to reach a level"""
 	return level * 1000  # 1000 XP per level
 
 
+@functools.cache
 def get_level_from_xp(xp):
 	"""Calculate level from XP"""
 	return max(1, xp // 1000)
 
 
-def format_duration(minutes):
-	"""Format minutes into human readable duration"""
+def get_levels_from_xp_array(xp):
+	"""Vectorized get_level_from_xp for an array of XP totals.
+
+	One ufunc over the whole array instead of a Python call per user;
+	use this when ranking many users at once (e.g. a leaderboard).
+	"""
+	return np.maximum(1, np.asarray(xp) // 1000)
+
+
+def _format_duration(minutes):
 	if minutes < 60:
 		return f"{minutes} min"
-	
+
 	hours = minutes // 60
 	remaining_minutes = minutes % 60
-	
+
 	if remaining_minutes == 0:
 		return f"{hours} hr"
-	
+
 	return f"{hours} hr {remaining_minutes} min"
+
+
+# Durations in listings overwhelmingly sit under a few hours, so the
+# first 0-240 minutes are formatted once at import and served by index
+_FMT = tuple(_format_duration(m) for m in range(241))
+
+
+def format_duration(minutes):
+	"""Format minutes into human readable duration"""
+	# Only ints can index the table; floats take the formula path as before
+	if isinstance(minutes, int) and 0 <= minutes <= 240:
+		return _FMT[minutes]
+	return _format_duration(minutes)